@@ -12,7 +12,8 @@ from src.api import deps
 from src.api.v1.schemas.media import (
     MediaUploadResponse,
     MediaDeleteResponse,
-    MediaBulkUploadResponse
+    MediaBulkUploadResponse,
+    PresignedUploadResponse
 )
 from src.config import settings
 from src.modules.media import service as media_service
@@ -26,15 +27,20 @@ from src.modules.media.exceptions import (
 router = APIRouter()
 
 
-@router.post("/upload", response_model=MediaUploadResponse)
+@router.post("/upload", response_model=MediaUploadResponse, deprecated=True)
 async def upload_image(
     file: UploadFile = File(...),
     folder: str = "general",
     current_user_id: UUID = Depends(deps.get_current_user_id_optional)
 ) -> MediaUploadResponse:
     """
-    Upload a single image file
-    
+    Upload a single image file (deprecated)
+
+    Deprecated: this proxies the full payload through the API process,
+    doubling bandwidth and tying up a worker per upload. Use
+    POST /media/generate-presigned-url and upload directly to storage;
+    the POST policy already enforces content type and size limits.
+
     - **file**: Image file (JPG, PNG, WebP)
     - **folder**: Destination folder in storage (default: "general")
     """
@@ -84,15 +90,18 @@ async def upload_image(
         )
 
 
-@router.post("/upload-multiple", response_model=MediaBulkUploadResponse)
+@router.post("/upload-multiple", response_model=MediaBulkUploadResponse, deprecated=True)
 async def upload_multiple_images(
     files: List[UploadFile] = File(...),
     folder: str = "general",
     current_user_id: UUID = Depends(deps.get_current_user_id_optional)
 ) -> MediaBulkUploadResponse:
     """
-    Upload multiple image files at once
-    
+    Upload multiple image files at once (deprecated)
+
+    Deprecated: prefer one POST /media/generate-presigned-url call per file
+    and client-direct uploads to storage.
+
     - **files**: List of image files (JPG, PNG, WebP)
     - **folder**: Destination folder in storage (default: "general")
     - **Maximum files**: 50 per request
@@ -204,15 +213,19 @@ async def delete_image(
         )
 
 
-@router.post("/generate-presigned-url")
+@router.post("/generate-presigned-url", response_model=PresignedUploadResponse)
 async def generate_presigned_upload_url(
     filename: str,
     content_type: str = "image/jpeg",
     folder: str = "general",
     current_user_id: UUID = Depends(deps.get_current_user_id_optional)
-) -> dict:
+) -> PresignedUploadResponse:
     """
     Generate a presigned URL for direct browser upload to S3
+
+    This is the preferred upload path: the browser POSTs the file straight
+    to storage with a policy restricting content type and size, and the API
+    never touches the payload.
     
     - **filename**: Original filename
     - **content_type**: MIME type of the file
@@ -252,6 +265,35 @@ async def generate_presigned_upload_url(
         )
 
 
+@router.post("/validate-images")
+async def validate_image_urls(urls: List[str]) -> dict:
+    """
+    Validate a batch of image URLs in one request
+
+    Existence is checked with one storage listing per folder instead of a
+    HeadObject round-trip per URL.
+
+    - **urls**: Image URLs to validate
+    - **Maximum URLs**: 50 per request
+    """
+    # Validate URL count; each folder in the batch costs a storage
+    # round-trip, so cap it like the upload-multiple endpoint
+    if len(urls) > 50:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Maximum 50 URLs can be validated at once"
+        )
+
+    try:
+        results = await media_service.validate_image_urls(urls)
+        return {"results": results}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to validate image URLs: {str(e)}"
+        )
+
+
 @router.get("/validate-image")
 async def validate_image_url(url: str) -> dict:
     """
@@ -62,9 +62,12 @@ class Settings(BaseSettings):
         data = info.data
         return f"postgresql+asyncpg://{data.get('POSTGRES_USER')}:{data.get('POSTGRES_PASSWORD')}@{data.get('POSTGRES_SERVER')}:{data.get('POSTGRES_PORT')}/{data.get('POSTGRES_DB')}"
 
-    # Database pool settings
-    DB_POOL_SIZE: int = 20
-    DB_MAX_OVERFLOW: int = 10
+    # Database pool settings (sized for 100+ concurrent players; recycle
+    # keeps long-lived connections ahead of server/LB idle timeouts)
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_TIMEOUT: int = 10  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 300  # seconds
     DB_POOL_PRE_PING: bool = True
     DB_ECHO: bool = False  # Set to True to log SQL queries
 
@@ -76,6 +79,12 @@ class Settings(BaseSettings):
     S3_REGION: str = "us-east-1"
     S3_USE_SSL: bool = False
 
+    # S3 client tuning (keep-alive + retries stabilize tail latency)
+    S3_CONNECT_TIMEOUT: int = 3
+    S3_READ_TIMEOUT: int = 10
+    S3_MAX_ATTEMPTS: int = 3
+    S3_MAX_POOL_CONNECTIONS: int = 50
+
     # File upload settings
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_IMAGE_EXTENSIONS: List[str] = [".jpg", ".jpeg", ".png", ".webp"]
@@ -5,6 +5,8 @@ PostgreSQL database setup with SQLAlchemy async support
 import logging
 from typing import AsyncGenerator
 
+import orjson
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
@@ -13,6 +15,12 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# asyncpg speaks the binary protocol natively, so there is no thread-pool
+# hop per query. The dialect's prepared-statement cache lets the repeated
+# point-lookup statements (get_by_id, get_by_code, ...) be prepared once
+# per connection instead of re-parsed on every execute.
+_connect_args = {"prepared_statement_cache_size": 512}
+
 # Create async engine
 if settings.is_development:
     # Use NullPool for development to avoid connection issues
@@ -21,15 +29,27 @@ if settings.is_development:
         echo=settings.DB_ECHO,
         poolclass=NullPool,
         pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_connect_args,
+        query_cache_size=2048,
+        json_serializer=lambda v: orjson.dumps(v).decode(),
+        json_deserializer=orjson.loads,
     )
 else:
-    # Use connection pooling for production
+    # Use connection pooling for production. create_async_engine defaults to
+    # AsyncAdaptedQueuePool (plain QueuePool must never be passed to an
+    # async engine), so only the sizing needs configuring here.
     engine = create_async_engine(
         settings.DATABASE_URL,
         echo=settings.DB_ECHO,
         pool_size=settings.DB_POOL_SIZE,
         max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
         pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_connect_args,
+        query_cache_size=2048,
+        json_serializer=lambda v: orjson.dumps(v).decode(),
+        json_deserializer=orjson.loads,
     )
 
 # Create async session maker
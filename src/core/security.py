@@ -3,8 +3,10 @@ Tournament Game Backend - Security Utilities
 JWT token handling, password hashing, and security functions
 """
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+import hashlib
 import secrets
+import time
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
@@ -15,6 +17,19 @@ from src.config import settings
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Short-lived memo for verify_password: bcrypt costs tens of
+# milliseconds of CPU by design, and reconnect storms re-verify the
+# same credentials over and over. Entries are keyed by a keyed blake2b
+# digest of (password, hash) - no plaintext is stored and the key makes
+# the cache useless for offline probing. The TTL keeps a revoked
+# password from verifying for more than a minute after a change.
+_VERIFY_CACHE_TTL = 60.0
+_VERIFY_CACHE_MAX = 1024
+_verify_cache: Dict[bytes, Tuple[float, bool]] = {}
+_verify_cache_key = hashlib.blake2b(
+    settings.SECRET_KEY.encode(), digest_size=32
+).digest()
+
 
 def create_access_token(
     subject: str,
@@ -90,7 +105,22 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    digest = hashlib.blake2b(
+        f"{plain_password}:{hashed_password}".encode(),
+        key=_verify_cache_key
+    ).digest()
+
+    now = time.monotonic()
+    cached = _verify_cache.get(digest)
+    if cached is not None and now - cached[0] < _VERIFY_CACHE_TTL:
+        return cached[1]
+
+    result = pwd_context.verify(plain_password, hashed_password)
+
+    if len(_verify_cache) >= _VERIFY_CACHE_MAX:
+        _verify_cache.clear()
+    _verify_cache[digest] = (now, result)
+    return result
 
 
 def get_password_hash(password: str) -> str:
@@ -3,12 +3,14 @@ Tournament Game Backend - Storage Configuration
 S3/MinIO storage client for media files
 """
 import logging
+import re
 from typing import Optional, Dict, Any, BinaryIO
 from datetime import datetime, timedelta
 import mimetypes
 from pathlib import Path
 
 import aioboto3
+from botocore.client import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from src.config import settings
@@ -31,14 +33,64 @@ class StorageClient:
         )
         self.endpoint_url = settings.S3_ENDPOINT_URL
         self.use_ssl = settings.S3_USE_SSL
-    
-    async def _get_client(self):
-        """Get S3 client"""
-        return self.session.client(
+        self._client = None
+        self._client_context = None
+        # Precompiled key-extraction pattern for public URLs; built once so
+        # extract_key_from_url is a single regex match per call
+        if self.endpoint_url:
+            # MinIO pattern: endpoint/bucket/key
+            host = self.endpoint_url.split('://', 1)[-1].rstrip('/')
+            self._key_pattern = re.compile(
+                rf"(?:https?://)?{re.escape(host)}/{re.escape(self.bucket_name)}/(.+?)(?:\?|$)"
+            )
+        else:
+            # AWS S3 pattern
+            self._key_pattern = re.compile(
+                rf"(?:https?://)?{re.escape(self.bucket_name)}"
+                rf"\.s3\.{re.escape(settings.S3_REGION)}\.amazonaws\.com/(.+?)(?:\?|$)"
+            )
+
+    async def initialize(self) -> None:
+        """
+        Create the long-lived S3 client.
+
+        Called once at application startup so every request reuses the same
+        connection pool instead of paying a TLS handshake per call.
+        """
+        if self._client is not None:
+            return
+
+        self._client_context = self.session.client(
             's3',
             endpoint_url=self.endpoint_url,
-            use_ssl=self.use_ssl
+            use_ssl=self.use_ssl,
+            config=Config(
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                tcp_keepalive=True,
+                connect_timeout=settings.S3_CONNECT_TIMEOUT,
+                read_timeout=settings.S3_READ_TIMEOUT,
+                retries={
+                    "max_attempts": settings.S3_MAX_ATTEMPTS,
+                    "mode": "adaptive"
+                }
+            )
         )
+        self._client = await self._client_context.__aenter__()
+        logger.info("Storage client initialized")
+
+    async def close(self) -> None:
+        """Close the S3 client. Called during application shutdown."""
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+            self._client = None
+            self._client_context = None
+            logger.info("Storage client closed")
+
+    async def _get_client(self):
+        """Get the shared S3 client, initializing it on first use"""
+        if self._client is None:
+            await self.initialize()
+        return self._client
     
     async def ensure_bucket_exists(self) -> bool:
         """
@@ -47,30 +99,30 @@ class StorageClient:
         Returns:
             True if bucket exists or was created successfully
         """
-        async with await self._get_client() as client:
-            try:
-                await client.head_bucket(Bucket=self.bucket_name)
-                logger.info(f"Bucket {self.bucket_name} exists")
-                return True
-            except ClientError as e:
-                error_code = e.response['Error']['Code']
-                if error_code == '404':
-                    # Bucket doesn't exist, create it
-                    try:
-                        await client.create_bucket(Bucket=self.bucket_name)
-                        logger.info(f"Created bucket {self.bucket_name}")
+        client = await self._get_client()
+        try:
+            await client.head_bucket(Bucket=self.bucket_name)
+            logger.info(f"Bucket {self.bucket_name} exists")
+            return True
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code == '404':
+                # Bucket doesn't exist, create it
+                try:
+                    await client.create_bucket(Bucket=self.bucket_name)
+                    logger.info(f"Created bucket {self.bucket_name}")
                         
-                        # Set bucket policy for public read (if needed)
-                        if settings.is_development:
-                            await self._set_public_read_policy()
+                    # Set bucket policy for public read (if needed)
+                    if settings.is_development:
+                        await self._set_public_read_policy()
                         
-                        return True
-                    except ClientError as create_error:
-                        logger.error(f"Failed to create bucket: {create_error}")
-                        return False
-                else:
-                    logger.error(f"Error checking bucket: {e}")
+                    return True
+                except ClientError as create_error:
+                    logger.error(f"Failed to create bucket: {create_error}")
                     return False
+            else:
+                logger.error(f"Error checking bucket: {e}")
+                return False
     
     async def _set_public_read_policy(self):
         """Set public read policy for development"""
@@ -87,12 +139,12 @@ class StorageClient:
             ]
         }
         
-        async with await self._get_client() as client:
-            import json
-            await client.put_bucket_policy(
-                Bucket=self.bucket_name,
-                Policy=json.dumps(policy)
-            )
+        client = await self._get_client()
+        import json
+        await client.put_bucket_policy(
+            Bucket=self.bucket_name,
+            Policy=json.dumps(policy)
+        )
     
     async def upload_file(
         self,
@@ -134,13 +186,13 @@ class StorageClient:
                 extra_args['Metadata'] = metadata
             
             # Upload file
-            async with await self._get_client() as client:
-                await client.upload_fileobj(
-                    file_content,
-                    self.bucket_name,
-                    key,
-                    ExtraArgs=extra_args
-                )
+            client = await self._get_client()
+            await client.upload_fileobj(
+                file_content,
+                self.bucket_name,
+                key,
+                ExtraArgs=extra_args
+            )
             
             logger.info(f"Successfully uploaded file to {key}")
             
@@ -165,11 +217,11 @@ class StorageClient:
             True if deleted successfully, False otherwise
         """
         try:
-            async with await self._get_client() as client:
-                await client.delete_object(
-                    Bucket=self.bucket_name,
-                    Key=key
-                )
+            client = await self._get_client()
+            await client.delete_object(
+                Bucket=self.bucket_name,
+                Key=key
+            )
             logger.info(f"Successfully deleted file {key}")
             return True
         except ClientError as e:
@@ -187,11 +239,11 @@ class StorageClient:
             True if file exists, False otherwise
         """
         try:
-            async with await self._get_client() as client:
-                await client.head_object(
-                    Bucket=self.bucket_name,
-                    Key=key
-                )
+            client = await self._get_client()
+            await client.head_object(
+                Bucket=self.bucket_name,
+                Key=key
+            )
             return True
         except ClientError:
             return False
@@ -207,11 +259,11 @@ class StorageClient:
             File information dict or None if not found
         """
         try:
-            async with await self._get_client() as client:
-                response = await client.head_object(
-                    Bucket=self.bucket_name,
-                    Key=key
-                )
+            client = await self._get_client()
+            response = await client.head_object(
+                Bucket=self.bucket_name,
+                Key=key
+            )
             
             return {
                 'size': response['ContentLength'],
@@ -253,23 +305,25 @@ class StorageClient:
             if max_size:
                 conditions.append(["content-length-range", 0, max_size])
             
-            async with await self._get_client() as client:
-                response = await client.generate_presigned_post(
-                    Bucket=self.bucket_name,
-                    Key=key,
-                    Fields=fields,
-                    Conditions=conditions,
-                    ExpiresIn=expires_in
-                )
+            client = await self._get_client()
+            response = await client.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=key,
+                Fields=fields,
+                Conditions=conditions,
+                ExpiresIn=expires_in
+            )
             
-            return {
+            presigned_data = {
                 'upload_url': response['url'],
                 'fields': response['fields'],
                 'file_url': self.get_public_url(key),
                 'expires_at': datetime.utcnow() + timedelta(seconds=expires_in),
                 'max_size': max_size or settings.MAX_UPLOAD_SIZE
             }
-            
+
+            return presigned_data
+
         except ClientError as e:
             logger.error(f"Failed to generate presigned URL: {e}")
             raise ExternalServiceError(
@@ -293,15 +347,15 @@ class StorageClient:
             List of file information dicts
         """
         try:
-            async with await self._get_client() as client:
-                params = {
-                    'Bucket': self.bucket_name,
-                    'MaxKeys': max_keys
-                }
-                if prefix:
-                    params['Prefix'] = prefix
+            client = await self._get_client()
+            params = {
+                'Bucket': self.bucket_name,
+                'MaxKeys': max_keys
+            }
+            if prefix:
+                params['Prefix'] = prefix
                 
-                response = await client.list_objects_v2(**params)
+            response = await client.list_objects_v2(**params)
             
             files = []
             for obj in response.get('Contents', []):
@@ -347,24 +401,8 @@ class StorageClient:
         Returns:
             S3 key or None if invalid URL
         """
-        # Remove protocol
-        if url.startswith('http://') or url.startswith('https://'):
-            url = url.split('://', 1)[1]
-        
-        # Extract key based on URL pattern
-        if self.endpoint_url:
-            # MinIO pattern: endpoint/bucket/key
-            prefix = self.endpoint_url.replace('http://', '').replace('https://', '')
-            pattern = f"{prefix}/{self.bucket_name}/"
-            if pattern in url:
-                return url.split(pattern, 1)[1]
-        else:
-            # AWS S3 pattern
-            pattern = f"{self.bucket_name}.s3.{settings.S3_REGION}.amazonaws.com/"
-            if pattern in url:
-                return url.split(pattern, 1)[1]
-        
-        return None
+        match = self._key_pattern.match(url)
+        return match.group(1) if match else None
 
 
 # Create global storage client instance
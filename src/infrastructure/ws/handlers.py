@@ -151,7 +151,7 @@ class WebSocketEventHandler:
                 vote_counts=vote_counts,
                 total_votes=sum(vote_counts.values()),
                 voters_count=len(voters),
-                players_voted=[str(v.player_id) for v in voters]
+                players_voted=[str(v["player_id"]) for v in voters]
             )
             
             await connection_manager.broadcast_to_session(
@@ -9,7 +9,8 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy import text
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 
@@ -17,7 +18,9 @@ from src.api.v1.router import api_router
 from src.config import settings
 from src.core.database import engine
 from src.core.exceptions import TournamentGameException
+from src.core.storage import storage_client
 from src.infrastructure.ws.connection_manager import connection_manager
+from src.modules.session import repository as session_repository
 from src.modules.competition.models import Base as CompetitionBase
 from src.modules.session.models import Base as SessionBase
 from src.modules.user.models import Base as UserBase
@@ -44,7 +47,7 @@ logger = logging.getLogger(__name__)
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for logging requests"""
-    
+
     async def dispatch(self, request: Request, call_next):
         logger.info(f"Request: {request.method} {request.url}")
         response = await call_next(request)
@@ -52,6 +55,17 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class RequestCacheMiddleware(BaseHTTPMiddleware):
+    """Middleware giving each request a fresh repository lookup cache"""
+
+    async def dispatch(self, request: Request, call_next):
+        token = session_repository.begin_request_cache()
+        try:
+            return await call_next(request)
+        finally:
+            session_repository.end_request_cache(token)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """
@@ -63,12 +77,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Initialize database tables (for development only)
     if settings.ENVIRONMENT == "development":
         async with engine.begin() as conn:
+            # Trigram extension backs the user-search GIN indexes
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
             # Create all tables
             await conn.run_sync(CompetitionBase.metadata.create_all)
             await conn.run_sync(SessionBase.metadata.create_all)
             await conn.run_sync(UserBase.metadata.create_all)
             logger.info("Database tables created successfully")
     
+    # Initialize long-lived S3 client
+    await storage_client.initialize()
+    logger.info("Storage client initialized")
+
     # Initialize WebSocket connection manager
     await connection_manager.initialize()
     logger.info("WebSocket connection manager initialized")
@@ -84,6 +104,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     await engine.dispose()
     logger.info("Database connections closed")
     
+    # Close S3 client
+    await storage_client.close()
+    logger.info("Storage client closed")
+
     # Clean up WebSocket connections
     await connection_manager.cleanup()
     logger.info("WebSocket connections cleaned up")
@@ -102,11 +126,15 @@ def create_application() -> FastAPI:
         openapi_url=f"{settings.API_V1_STR}/openapi.json" if settings.ENVIRONMENT != "production" else None,
         docs_url=f"{settings.API_V1_STR}/docs" if settings.ENVIRONMENT != "production" else None,
         redoc_url=f"{settings.API_V1_STR}/redoc" if settings.ENVIRONMENT != "production" else None,
+        # orjson serializes responses in C; the round-results and bracket
+        # payloads are the largest beneficiaries
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
     
     # Add middlewares
     app.add_middleware(LoggingMiddleware)
+    app.add_middleware(RequestCacheMiddleware)
     
     # CORS middleware
     app.add_middleware(
@@ -161,7 +189,15 @@ def create_application() -> FastAPI:
         
         status_code = 200 if health_status["status"] == "healthy" else 503
         return JSONResponse(content=health_status, status_code=status_code)
-    
+
+    # Connection pool health endpoint
+    @app.get("/health/pool", tags=["Health"])
+    async def pool_status():
+        """
+        Expose connection pool state for monitoring
+        """
+        return {"pool": engine.pool.status()}
+
     # Global exception handler
     @app.exception_handler(TournamentGameException)
     async def tournament_exception_handler(request: Request, exc: TournamentGameException):
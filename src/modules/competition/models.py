@@ -3,7 +3,7 @@ Tournament Game Backend - Competition Models
 SQLAlchemy models for competition entities
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 from uuid import uuid4
 
 from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Index
@@ -11,8 +11,10 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from src.core.database import Base
-from src.modules.session.models import GameSession
-from src.modules.user.models import User
+
+if TYPE_CHECKING:
+    from src.modules.session.models import GameSession, Vote
+    from src.modules.user.models import User
 
 
 class Competition(Base):
@@ -17,6 +17,39 @@ from src.modules.session.models import GameSession
 logger = logging.getLogger(__name__)
 
 
+def _make_setter(model):
+    """
+    Generate an unrolled per-column setter for a model's update path
+
+    The generated function replaces the per-key hasattr/setattr reflection
+    in update methods with direct attribute assignments over the known
+    column list (id and created_at are never updatable).
+    """
+    cols = [c.name for c in model.__table__.columns if c.name not in ("id", "created_at")]
+    body = "def _set(obj, kw):\n" + "\n".join(
+        f"    if '{c}' in kw: obj.{c} = kw['{c}']" for c in cols
+    )
+    namespace = {}
+    exec(body, namespace)
+    return namespace["_set"]
+
+
+_SET_COMPETITION = _make_setter(Competition)
+_SET_ITEM = _make_setter(CompetitionItem)
+
+
+def _item_cache(db: AsyncSession) -> dict:
+    """
+    Per-session item lookup cache stored on the session's info dict
+
+    Items are effectively immutable while a game session is running, and
+    the hot polling paths resolve the same one or two item IDs on every
+    tick. Caching on db.info scopes the entries to a single request's
+    database session, so nothing leaks across requests.
+    """
+    return db.info.setdefault("item_cache", {})
+
+
 class CompetitionRepository:
     """Repository class for competition data access"""
     
@@ -191,10 +224,7 @@ class CompetitionRepository:
         Returns:
             Updated competition
         """
-        for key, value in kwargs.items():
-            if hasattr(competition, key):
-                setattr(competition, key, value)
-        
+        _SET_COMPETITION(competition, kwargs)
         competition.updated_at = datetime.utcnow()
         
         await db.flush()
@@ -272,10 +302,17 @@ class CompetitionRepository:
         Returns:
             Item or None
         """
+        cache = _item_cache(db)
+        if item_id in cache:
+            return cache[item_id]
+
         query = select(CompetitionItem).where(CompetitionItem.id == item_id)
         result = await db.execute(query)
-        return result.scalar_one_or_none()
-    
+        item = result.scalar_one_or_none()
+        if item is not None:
+            cache[item_id] = item
+        return item
+
     async def get_items(
         self,
         db: AsyncSession,
@@ -316,10 +353,18 @@ class CompetitionRepository:
         """
         if not item_ids:
             return []
-        
-        query = select(CompetitionItem).where(CompetitionItem.id.in_(item_ids))
-        result = await db.execute(query)
-        return list(result.scalars().all())
+
+        cache = _item_cache(db)
+        items = [cache[item_id] for item_id in item_ids if item_id in cache]
+        missing = [item_id for item_id in item_ids if item_id not in cache]
+        if missing:
+            query = select(CompetitionItem).where(CompetitionItem.id.in_(missing))
+            result = await db.execute(query)
+            fetched = result.scalars().all()
+            for item in fetched:
+                cache[item.id] = item
+            items.extend(fetched)
+        return items
     
     async def update_item(
         self,
@@ -338,15 +383,13 @@ class CompetitionRepository:
         Returns:
             Updated item
         """
-        for key, value in kwargs.items():
-            if hasattr(item, key):
-                setattr(item, key, value)
-        
+        _SET_ITEM(item, kwargs)
         item.updated_at = datetime.utcnow()
-        
+
         await db.flush()
         await db.refresh(item)
-        
+
+        _item_cache(db)[item.id] = item
         return item
     
     async def delete_item(
@@ -364,6 +407,7 @@ class CompetitionRepository:
         Returns:
             True if deleted
         """
+        _item_cache(db).pop(item.id, None)
         await db.delete(item)
         await db.flush()
         return True
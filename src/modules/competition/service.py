@@ -365,6 +365,14 @@ class CompetitionService:
                 item.order_index = index
                 await self.repository.update_item(db, item)
     
+    async def get_item_count(
+        self,
+        db: AsyncSession,
+        competition_id: UUID
+    ) -> int:
+        """Get the number of items in a competition as a scalar count"""
+        return await self.repository.get_item_count(db, competition_id)
+
     async def get_items_by_ids(
         self,
         db: AsyncSession,
@@ -5,8 +5,10 @@ Business logic for media/file management
 import logging
 import os
 import mimetypes
-from typing import Optional, BinaryIO, Dict, Any
-from uuid import UUID, uuid4
+import secrets
+import time
+from typing import Optional, BinaryIO, Dict, List, Any, Tuple
+from uuid import UUID
 from datetime import datetime
 
 import aiofiles
@@ -23,49 +25,89 @@ from src.modules.media.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Deletion table for folder names: strips path separators, dots and control
+# characters in a single C-level pass to prevent path traversal
+_FOLDER_SANITIZE = str.maketrans('', '', './\\' + ''.join(map(chr, range(32))))
+
+
+# Map content types to extensions
+CONTENT_TYPE_MAP = {
+    'image/jpeg': ['.jpg', '.jpeg'],
+    'image/png': ['.png'],
+    'image/webp': ['.webp']
+}
+
+
+def generate_storage_key(folder: str, ext: str) -> str:
+    """
+    Generate a unique S3 key for an upload
+
+    Uses time.time_ns + secrets.token_hex instead of strftime + uuid4,
+    which is several times cheaper on hot presign/upload paths.
+
+    Args:
+        folder: Destination folder (already sanitized)
+        ext: File extension including the dot
+
+    Returns:
+        S3 key like "general/68b0a1c2_d4e5f6a7.jpg"
+    """
+    return f"{folder}/{time.time_ns() // 1_000_000_000:x}_{secrets.token_hex(4)}{ext}"
+
+
+def sniff_image_type(header: bytes) -> Optional[str]:
+    """
+    Detect image type from the leading magic bytes
+
+    Args:
+        header: First bytes of the file (12 bytes are enough)
+
+    Returns:
+        Content type string or None if not a supported image
+    """
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if header.startswith(b'RIFF') and header[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
 
 class MediaService:
     """Service class for media-related operations"""
-    
+
     def __init__(self):
         self.storage = storage_client
         self.allowed_extensions = settings.ALLOWED_IMAGE_EXTENSIONS
         self.max_file_size = settings.MAX_UPLOAD_SIZE
-    
+        # Precomputed lookup sets so validation is two O(1) membership checks
+        self._allowed_exts = frozenset(self.allowed_extensions)
+        self._allowed_content_types = frozenset(
+            ct for ct, exts in CONTENT_TYPE_MAP.items()
+            if any(ext in self._allowed_exts for ext in exts)
+        )
+
     def validate_image_file(self, file: UploadFile) -> bool:
         """
         Validate if a file is an allowed image type
-        
+
         Args:
             file: UploadFile object
-            
+
         Returns:
             True if valid, False otherwise
         """
         # Check file extension
         if file.filename:
-            ext = os.path.splitext(file.filename)[1].lower()
-            if ext not in self.allowed_extensions:
+            ext = '.' + file.filename.rpartition('.')[2].lower()
+            if ext not in self._allowed_exts:
                 return False
-        
+
         # Check content type
-        if file.content_type:
-            if not file.content_type.startswith('image/'):
-                return False
-            
-            # Map content types to extensions
-            content_type_map = {
-                'image/jpeg': ['.jpg', '.jpeg'],
-                'image/png': ['.png'],
-                'image/webp': ['.webp']
-            }
-            
-            allowed_types = [ct for ct, exts in content_type_map.items() 
-                           if any(ext in self.allowed_extensions for ext in exts)]
-            
-            if file.content_type not in allowed_types:
-                return False
-        
+        if file.content_type and file.content_type not in self._allowed_content_types:
+            return False
+
         return True
     
     async def upload_image(
@@ -105,42 +147,46 @@ class MediaService:
         
         try:
             # Generate unique filename
-            timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-            unique_id = str(uuid4())[:8]
             ext = os.path.splitext(file.filename)[1].lower() if file.filename else '.jpg'
-            
+
             # Sanitize folder name
-            folder = folder.replace('.', '').replace('/', '')
-            
+            folder = folder.translate(_FOLDER_SANITIZE)
+
             # Construct S3 key
-            key = f"{folder}/{timestamp}_{unique_id}{ext}"
-            
-            # Read file content
-            content = await file.read()
+            key = generate_storage_key(folder, ext)
             
-            # Reset file position for potential re-reading
+            # Verify magic bytes before paying for the upload - the client-sent
+            # Content-Type and extension are both attacker-controlled
+            header = await file.read(12)
+            detected_type = sniff_image_type(header)
+            if detected_type is None or detected_type not in self._allowed_content_types:
+                raise FileValidationError(
+                    "File content does not match an allowed image type"
+                )
+
+            # Rewind and stream the spooled upload file straight to storage
+            # instead of copying it through bytes + BytesIO
             await file.seek(0)
-            
-            # Upload to storage
-            import io
-            file_obj = io.BytesIO(content)
-            
+
+            uploaded_at = datetime.utcnow()
             url = await self.storage.upload_file(
-                file_content=file_obj,
+                file_content=file.file,
                 key=key,
                 content_type=file.content_type,
                 metadata={
                     "original_filename": file.filename or "unknown",
                     "uploaded_by": str(user_id) if user_id else "anonymous",
-                    "upload_timestamp": datetime.utcnow().isoformat()
+                    "upload_timestamp": uploaded_at.isoformat()
                 }
             )
             
-            logger.info(f"Successfully uploaded image: {key}")
+            logger.info("Successfully uploaded image: %s", key)
             return url
-            
+
+        except FileValidationError:
+            raise
         except Exception as e:
-            logger.error(f"Failed to upload image: {e}")
+            logger.error("Failed to upload image: %s", e)
             raise FileUploadError(f"Failed to upload file: {str(e)}")
     
     async def delete_image(
@@ -161,10 +207,10 @@ class MediaService:
         try:
             success = await self.storage.delete_file(file_key)
             if success:
-                logger.info(f"Deleted image: {file_key} by user {user_id}")
+                logger.info("Deleted image: %s by user %s", file_key, user_id)
             return success
         except Exception as e:
-            logger.error(f"Failed to delete image {file_key}: {e}")
+            logger.error("Failed to delete image %s: %s", file_key, e)
             return False
     
     def extract_key_from_url(self, url: str) -> Optional[str]:
@@ -206,9 +252,7 @@ class MediaService:
             )
         
         # Generate unique key
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        unique_id = str(uuid4())[:8]
-        key = f"{folder}/{timestamp}_{unique_id}{ext}"
+        key = generate_storage_key(folder, ext)
         
         # Generate presigned URL
         presigned_data = await self.storage.generate_presigned_upload_url(
@@ -239,9 +283,54 @@ class MediaService:
             # Check if file exists
             return await self.storage.file_exists(key)
         except Exception as e:
-            logger.error(f"Error validating image URL {url}: {e}")
+            logger.error("Error validating image URL %s: %s", url, e)
             return False
     
+    async def validate_image_urls(self, urls: List[str]) -> Dict[str, bool]:
+        """
+        Validate multiple image URLs with batched existence checks
+
+        Instead of one HeadObject round-trip per URL, lists each referenced
+        folder once and answers membership from the returned key set. Keys
+        that cannot be answered from a listing - root-level keys with no
+        folder, or folders whose listing hits the page cap and may be
+        truncated - fall back to the exact per-key existence check.
+
+        Args:
+            urls: Image URLs to validate
+
+        Returns:
+            Mapping of url -> whether the file exists
+        """
+        max_keys = 1000
+        keys = {url: self.extract_key_from_url(url) for url in urls}
+
+        results: Dict[str, bool] = {url: False for url in urls}
+        by_prefix: Dict[str, List[Tuple[str, str]]] = {}
+        for url, key in keys.items():
+            if not key:
+                continue
+            if '/' in key:
+                prefix = key.rsplit('/', 1)[0] + '/'
+                by_prefix.setdefault(prefix, []).append((url, key))
+            else:
+                # No folder to list; check the key directly
+                results[url] = await self.storage.file_exists(key)
+
+        for prefix, members in by_prefix.items():
+            files = await self.storage.list_files(prefix=prefix, max_keys=max_keys)
+            if len(files) >= max_keys:
+                # The listing may be truncated; a missing key proves
+                # nothing, so fall back to exact checks for this folder
+                for url, key in members:
+                    results[url] = await self.storage.file_exists(key)
+                continue
+            existing_keys = {f['key'] for f in files}
+            for url, key in members:
+                results[url] = key in existing_keys
+
+        return results
+
     async def get_file_info(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Get information about a file from its URL
@@ -255,7 +344,21 @@ class MediaService:
         key = self.extract_key_from_url(url)
         if not key:
             return None
-        
+
+        return await self.storage.get_file_info(key)
+
+    async def get_file_info_by_key(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get information about a file from its S3 key
+
+        Skips URL parsing entirely for callers that already hold the key.
+
+        Args:
+            key: S3 key of the file
+
+        Returns:
+            File information or None
+        """
         return await self.storage.get_file_info(key)
 
 
@@ -292,3 +395,9 @@ async def generate_presigned_upload_url(
 
 async def validate_image_url(url: str) -> bool:
     return await media_service.validate_image_url(url)
+
+async def validate_image_urls(urls: List[str]) -> Dict[str, bool]:
+    return await media_service.validate_image_urls(urls)
+
+async def get_file_info_by_key(key: str) -> Optional[Dict[str, Any]]:
+    return await media_service.get_file_info_by_key(key)
@@ -3,16 +3,18 @@ Tournament Game Backend - Session Models
 SQLAlchemy models for game session entities
 """
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from uuid import uuid4
 
-from sqlalchemy import Column, String, Text, DateTime, Integer, Float, ForeignKey, Index, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import CHAR, Column, Enum, String, Text, DateTime, Integer, Float, ForeignKey, Index, func, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from src.core.database import Base
-from src.modules.competition.models import Competition
-from src.modules.user.models import User
+
+if TYPE_CHECKING:
+    from src.modules.competition.models import Competition, CompetitionItem
+    from src.modules.user.models import User
 
 
 class GameSession(Base):
@@ -27,23 +29,27 @@ class GameSession(Base):
         nullable=False
     )
     
-    # Session code for joining
+    # Session code for joining (fixed length, equality-only lookups)
     code: Mapped[str] = mapped_column(
-        String(6),
+        CHAR(6),
         nullable=False,
         unique=True,
-        index=True,
         comment="Unique code for joining the session"
     )
-    
 
-    
+    # Competition reference
+    competition_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("competitions.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Competition being played in this session"
+    )
+
     # Organizer info
     organizer_id: Mapped[Optional[UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
         comment="User who created the session"
     )
     
@@ -53,12 +59,15 @@ class GameSession(Base):
         comment="Display name of the organizer"
     )
     
-    # Session state
+    # Session state (native enum: single-byte comparisons instead of
+    # string compares in status filters)
     status: Mapped[str] = mapped_column(
-        String(20),
+        Enum(
+            "waiting", "in_progress", "completed", "cancelled",
+            name="session_status"
+        ),
         nullable=False,
         default="waiting",
-        index=True,
         comment="Session status: waiting, in_progress, completed, cancelled"
     )
     
@@ -73,7 +82,24 @@ class GameSession(Base):
         nullable=True,
         comment="Total number of rounds"
     )
-    
+
+    # Denormalized counters, maintained in the same transaction as
+    # add_player / vote inserts: O(1) reads instead of COUNT(*) scans
+    player_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of players in the session"
+    )
+
+    vote_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Total votes cast in the session"
+    )
+
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -97,7 +123,7 @@ class GameSession(Base):
     updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
-        onupdate=datetime.utcnow,
+        onupdate=func.now(),
         comment="Last update time"
     )
     
@@ -133,8 +159,19 @@ class GameSession(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_session_code", "code"),
-        Index("idx_session_status", "status"),
+        # Hash index for join-by-code, the hottest equality lookup; the
+        # unique constraint keeps its own B-tree since hash indexes cannot
+        # enforce uniqueness
+        Index("idx_session_code", "code", postgresql_using="hash"),
+        # Partial index: almost all status queries target live sessions, and
+        # completed/cancelled rows only bloat a full index. competition_id
+        # serves the per-competition active counts, and created_at lets
+        # active-session listings skip the sort.
+        Index(
+            "idx_session_active",
+            "status", "competition_id", "created_at",
+            postgresql_where=text("status IN ('waiting', 'in_progress')")
+        ),
         Index("idx_session_competition", "competition_id"),
         Index("idx_session_organizer", "organizer_id"),
         Index("idx_session_created", "created_at"),
@@ -160,16 +197,14 @@ class SessionPlayer(Base):
     session_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("game_sessions.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # User reference (optional for guests)
     user_id: Mapped[Optional[UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     # Player info
@@ -212,8 +247,10 @@ class SessionPlayer(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_session_player_session", "session_id"),
-        Index("idx_session_player_user", "user_id"),
+        # session_id lookups are covered by the unique composite's prefix;
+        # including session_id here lets the per-user session counts and
+        # the history join run as index-only scans
+        Index("idx_session_player_user", "user_id", "session_id"),
         Index("idx_session_player_unique", "session_id", "user_id", unique=True),
     )
     
@@ -237,16 +274,14 @@ class Vote(Base):
     session_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("game_sessions.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Player reference
     player_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("session_players.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Item reference
@@ -304,12 +339,18 @@ class Vote(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_vote_session", "session_id"),
         Index("idx_vote_player", "player_id"),
-        Index("idx_vote_round_pair", "session_id", "round_number", "pair_index"),
+        # Covering index so round tallies and voter lists (item_id, weight,
+        # player_id projections) are satisfied from the index alone without
+        # heap fetches. Also subsumes the old idx_vote_session index.
+        Index(
+            "idx_vote_tally_cover",
+            "session_id", "round_number", "pair_index",
+            postgresql_include=["item_id", "player_id", "weight"]
+        ),
         Index("idx_vote_unique", "session_id", "player_id", "round_number", "pair_index", unique=True),
     )
-    
+
     def __repr__(self) -> str:
         return f"<Vote(id={self.id}, player_id={self.player_id}, item_id={self.item_id}, round={self.round_number})>"
 
@@ -330,8 +371,7 @@ class SessionRound(Base):
     session_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("game_sessions.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Round info
@@ -341,9 +381,9 @@ class SessionRound(Base):
         comment="Round number (1-based)"
     )
     
-    # Round data (JSON)
+    # Round data (JSONB - stored pre-parsed, supports indexed containment queries)
     round_data: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=False,
         default=dict,
         comment="Round data including pairs, winners, bye item"
@@ -385,12 +425,102 @@ class SessionRound(Base):
         "GameSession",
         back_populates="rounds"
     )
-    
+
+    pairs: Mapped[List["SessionRoundPair"]] = relationship(
+        "SessionRoundPair",
+        back_populates="round",
+        cascade="all, delete-orphan",
+        order_by="SessionRoundPair.pair_index"
+    )
+
     # Indexes
     __table_args__ = (
-        Index("idx_round_session", "session_id"),
+        # session_id lookups are covered by the unique composite's prefix
         Index("idx_round_number", "session_id", "round_number", unique=True),
+        Index("idx_round_data_gin", "round_data", postgresql_using="gin"),
     )
-    
+
     def __repr__(self) -> str:
         return f"<SessionRound(id={self.id}, session_id={self.session_id}, round={self.round_number})>"
+
+
+class SessionRoundPair(Base):
+    """
+    Session round pair model - normalized pair state for a round
+
+    Mirrors round_data["pairs"] so that resolving a vote is a single-row
+    UPDATE instead of rewriting the whole round_data JSON value.
+    """
+    __tablename__ = "session_round_pairs"
+
+    # Primary key
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid4,
+        nullable=False
+    )
+
+    # Round reference
+    round_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("session_rounds.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    # Position of the pair within the round
+    pair_index: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Index of the pair in the round (0-based)"
+    )
+
+    # Items in the pair
+    item1_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("competition_items.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    item2_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("competition_items.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    # Result
+    winner_id: Mapped[Optional[UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("competition_items.id", ondelete="SET NULL"),
+        nullable=True,
+        comment="Winning item, null while voting is open"
+    )
+
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the pair was decided"
+    )
+
+    # Relationships
+    round: Mapped["SessionRound"] = relationship(
+        "SessionRound",
+        back_populates="pairs"
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_round_pair_unique", "round_id", "pair_index", unique=True),
+        # Open-pair lookups (next pair to vote on, pairs left) only ever
+        # touch undecided rows, so index just those
+        Index(
+            "idx_round_pair_open",
+            "round_id",
+            "pair_index",
+            postgresql_where=text("winner_id IS NULL")
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SessionRoundPair(round_id={self.round_id}, pair_index={self.pair_index}, winner_id={self.winner_id})>"
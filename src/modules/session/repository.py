@@ -3,22 +3,97 @@ Tournament Game Backend - Session Repository
 Data access layer for session entities
 """
 import logging
-from typing import List, Optional, Tuple
+from contextvars import ContextVar, Token
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import select, func, and_, or_, update
+from sqlalchemy import select, func, and_, or_, update, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 
-from src.modules.session.models import GameSession, SessionPlayer, Vote, SessionRound
+from src.modules.session.models import (
+    GameSession,
+    SessionPlayer,
+    Vote,
+    SessionRound,
+    SessionRoundPair,
+)
 
 logger = logging.getLogger(__name__)
 
+# Request-scoped lookup cache. The same session/player is often fetched
+# several times within one request (auth check, handler, websocket join);
+# the identity map only helps for by-PK gets on the same AsyncSession, so
+# point lookups are memoized here for the lifetime of a request. The
+# middleware in main.py installs a fresh dict per request; outside a
+# request the ContextVar is None and lookups hit the database as before.
+_request_cache: ContextVar[Optional[Dict[Tuple, Any]]] = ContextVar(
+    "_session_repo_cache", default=None
+)
+
+
+def begin_request_cache() -> Token:
+    """Install a fresh per-request lookup cache; returns the reset token"""
+    return _request_cache.set({})
+
+
+def end_request_cache(token: Token) -> None:
+    """Drop the per-request lookup cache"""
+    _request_cache.reset(token)
+
+
+# Version-keyed cache for the polled sessions listing. Every write to
+# game_sessions - including the denormalized player_count/vote_count
+# bumps - must call _bump_sessions_version, so a hit means nothing has
+# changed since the identical page was served and the whole round-trip
+# can be skipped.
+_listing_cache: Dict[Tuple, Tuple[int, Tuple[List["GameSession"], int]]] = {}
+_listing_cache_max_size = 256
+_sessions_version = 0
+
+
+def _bump_sessions_version() -> None:
+    """Invalidate cached listing pages after any game_sessions write"""
+    global _sessions_version
+    _sessions_version += 1
+
+
+# Hot point-lookup statements, built once at import time so per-call work
+# is just parameter binding instead of expression-tree construction plus a
+# compile-cache lookup
+_GS_BY_CODE = select(GameSession).where(GameSession.code == bindparam("code")).limit(1)
+_PLAYER_BY_USER = select(SessionPlayer).where(
+    and_(
+        SessionPlayer.session_id == bindparam("session_id"),
+        SessionPlayer.user_id == bindparam("user_id")
+    )
+).limit(1)
+_VOTES_FOR_PAIR = select(Vote).where(
+    and_(
+        Vote.session_id == bindparam("session_id"),
+        Vote.round_number == bindparam("round_number"),
+        Vote.pair_index == bindparam("pair_index")
+    )
+)
+_ROUND_BY_NUM = select(SessionRound).where(
+    and_(
+        SessionRound.session_id == bindparam("session_id"),
+        SessionRound.round_number == bindparam("round_number")
+    )
+).limit(1)
+
 
 class SessionRepository:
     """Repository class for session data access"""
-    
+
+    # Valid column names for the bulk update paths, built once instead of
+    # probing hasattr() per key on every call
+    _SESSION_UPDATABLE = frozenset(c.name for c in GameSession.__table__.columns)
+    _ROUND_UPDATABLE = frozenset(c.name for c in SessionRound.__table__.columns)
+
+
     async def create(
         self,
         db: AsyncSession,
@@ -26,32 +101,41 @@ class SessionRepository:
         competition_id: UUID,
         organizer_id: Optional[UUID] = None,
         organizer_name: str = "Organizer"
-    ) -> GameSession:
+    ) -> Optional[GameSession]:
         """
-        Create a new game session
-        
+        Create a new game session with an optimistic code insert
+
+        The INSERT carries ON CONFLICT (code) DO NOTHING, so a code
+        collision is detected by the insert itself instead of a separate
+        existence probe; the caller regenerates the code and retries.
+
         Args:
             db: Database session
             code: Unique session code
             competition_id: Competition ID
             organizer_id: User ID of organizer
             organizer_name: Display name of organizer
-            
+
         Returns:
-            Created game session
-        """
-        session = GameSession(
-            code=code,
-            competition_id=competition_id,
-            organizer_id=organizer_id,
-            organizer_name=organizer_name,
-            status="waiting"
+            Created game session, or None if the code is already taken
+        """
+        stmt = (
+            pg_insert(GameSession)
+            .values(
+                code=code,
+                competition_id=competition_id,
+                organizer_id=organizer_id,
+                organizer_name=organizer_name,
+                status="waiting"
+            )
+            .on_conflict_do_nothing(index_elements=["code"])
+            .returning(GameSession)
         )
-        
-        db.add(session)
-        await db.flush()
-        await db.refresh(session)
-        
+        result = await db.execute(stmt)
+        session = result.scalar_one_or_none()
+
+        if session is not None:
+            _bump_sessions_version()
         return session
     
     async def get_by_id(
@@ -69,9 +153,18 @@ class SessionRepository:
         Returns:
             Session or None
         """
-        query = select(GameSession).where(GameSession.id == session_id)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+        cache = _request_cache.get()
+        key = ("session", session_id)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        # AsyncSession.get hits the identity map first and uses SQLAlchemy's
+        # precompiled PK fetch on miss - no statement compilation at all
+        session = await db.get(GameSession, session_id)
+
+        if cache is not None and session is not None:
+            cache[key] = session
+        return session
     
     async def get_by_code(
         self,
@@ -88,9 +181,18 @@ class SessionRepository:
         Returns:
             Session or None
         """
-        query = select(GameSession).where(GameSession.code == code)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+        cache = _request_cache.get()
+        key = ("session_code", code)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        result = await db.execute(_GS_BY_CODE, {"code": code})
+        session = result.scalar_one_or_none()
+
+        if cache is not None and session is not None:
+            cache[key] = session
+            cache[("session", session.id)] = session
+        return session
     
     async def get_with_players(
         self,
@@ -114,7 +216,39 @@ class SessionRepository:
         )
         result = await db.execute(query)
         return result.scalar_one_or_none()
-    
+
+    async def get_full(
+        self,
+        db: AsyncSession,
+        session_id: UUID
+    ) -> Optional[GameSession]:
+        """
+        Get session with players, their votes and rounds eager-loaded
+
+        One chained loader pipeline (a fixed number of queries) instead of
+        the N+1 that lazy player.votes access would trigger. Use this from
+        scoreboard/result paths; get_with_players stays cheap for callers
+        that only need the roster.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+
+        Returns:
+            Fully-loaded session or None
+        """
+        query = (
+            select(GameSession)
+            .options(
+                selectinload(GameSession.players).selectinload(SessionPlayer.votes),
+                selectinload(GameSession.rounds),
+            )
+            .where(GameSession.id == session_id)
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+
     async def get_paginated(
         self,
         db: AsyncSession,
@@ -138,36 +272,51 @@ class SessionRepository:
         Returns:
             Tuple of (sessions, total_count)
         """
-        # Base query
-        query = select(GameSession)
-        count_query = select(func.count()).select_from(GameSession)
-        
-        # Apply filters
-        if status:
-            query = query.where(GameSession.status == status)
-            count_query = count_query.where(GameSession.status == status)
-        
+        # Serve a repeat poll of the same page from cache while no session
+        # has been written since it was produced
+        cache_key = (status, competition_id, organizer_id, skip, limit)
+        version = _sessions_version
+        cached = _listing_cache.get(cache_key)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        # Collect filters once, shared by page and count, ordered most
+        # selective first (UUID equality narrows far more than status)
+        filters = []
         if competition_id:
-            query = query.where(GameSession.competition_id == competition_id)
-            count_query = count_query.where(GameSession.competition_id == competition_id)
-        
+            filters.append(GameSession.competition_id == competition_id)
         if organizer_id:
-            query = query.where(GameSession.organizer_id == organizer_id)
-            count_query = count_query.where(GameSession.organizer_id == organizer_id)
-        
-        # Get total count
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-        
-        # Apply ordering and pagination
-        query = query.order_by(GameSession.created_at.desc())
-        query = query.offset(skip).limit(limit)
-        
-        # Execute query
+            filters.append(GameSession.organizer_id == organizer_id)
+        if status:
+            filters.append(GameSession.status == status)
+
+        # Window-function count rides along with the page rows, so one
+        # round-trip and one plan serve both
+        total_col = func.count().over().label("_total")
+        query = (
+            select(GameSession, total_col)
+            .where(*filters)
+            .order_by(GameSession.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
         result = await db.execute(query)
-        sessions = list(result.scalars().all())
-        
-        return sessions, total
+        rows = result.all()
+
+        if rows:
+            page = ([row[0] for row in rows], rows[0]._total)
+        else:
+            # Past the last page: the count still has to come from somewhere
+            count_query = select(func.count()).select_from(GameSession).where(*filters)
+            total = (await db.execute(count_query)).scalar() or 0
+            page = ([], total)
+
+        if len(_listing_cache) >= _listing_cache_max_size:
+            _listing_cache.clear()
+        _listing_cache[cache_key] = (version, page)
+
+        return page
     
     async def update(
         self,
@@ -186,17 +335,31 @@ class SessionRepository:
         Returns:
             Updated session
         """
-        for key, value in kwargs.items():
-            if hasattr(session, key):
-                setattr(session, key, value)
-        
-        session.updated_at = datetime.utcnow()
-        
-        await db.flush()
-        await db.refresh(session)
-        
-        return session
-    
+        # Single Core UPDATE ... RETURNING: no attribute-history bookkeeping
+        # and no follow-up SELECT
+        values = {k: v for k, v in kwargs.items() if k in self._SESSION_UPDATABLE}
+        # DB-side timestamp: no Python serialization and consistent across
+        # app nodes
+        values["updated_at"] = func.now()
+
+        stmt = (
+            update(GameSession)
+            .where(GameSession.id == session.id)
+            .values(**values)
+            .returning(GameSession)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        updated = result.scalar_one()
+
+        cache = _request_cache.get()
+        if cache is not None:
+            cache.pop(("session", session.id), None)
+            cache.pop(("session_code", session.code), None)
+
+        _bump_sessions_version()
+        return updated
+
     async def delete(
         self,
         db: AsyncSession,
@@ -212,8 +375,14 @@ class SessionRepository:
         Returns:
             True if deleted
         """
+        cache = _request_cache.get()
+        if cache is not None:
+            cache.pop(("session", session.id), None)
+            cache.pop(("session_code", session.code), None)
+
         await db.delete(session)
         await db.flush()
+        _bump_sessions_version()
         return True
     
     # Player methods
@@ -248,20 +417,165 @@ class SessionRepository:
         
         db.add(player)
         await db.flush()
-        await db.refresh(player)
-        
+
+        # Keep the denormalized counter in the same transaction
+        await db.execute(
+            update(GameSession)
+            .where(GameSession.id == session_id)
+            .values(player_count=GameSession.player_count + 1)
+        )
+        _bump_sessions_version()
+
         return player
-    
+
+    async def add_player_if_space(
+        self,
+        db: AsyncSession,
+        session_id: UUID,
+        user_id: Optional[UUID],
+        nickname: str,
+        max_players: int,
+        is_organizer: bool = False
+    ) -> Optional[SessionPlayer]:
+        """
+        Add a player only if the session still has capacity
+
+        The guarded UPDATE on the denormalized player_count both enforces
+        the limit and takes the session's row lock, so two concurrent
+        joiners cannot overflow the capacity: the second one sees the
+        bumped counter and gets no row back.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+            user_id: User ID (optional)
+            nickname: Player nickname
+            max_players: Maximum players allowed in the session
+            is_organizer: Whether player is organizer
+
+        Returns:
+            Created player, or None if the session is full
+        """
+        result = await db.execute(
+            update(GameSession)
+            .where(
+                and_(
+                    GameSession.id == session_id,
+                    GameSession.player_count < max_players
+                )
+            )
+            .values(player_count=GameSession.player_count + 1)
+        )
+        if result.rowcount == 0:
+            return None
+        _bump_sessions_version()
+
+        player = SessionPlayer(
+            session_id=session_id,
+            user_id=user_id,
+            nickname=nickname,
+            is_organizer=is_organizer
+        )
+        db.add(player)
+        await db.flush()
+        return player
+
     async def get_player(
         self,
         db: AsyncSession,
         player_id: UUID
     ) -> Optional[SessionPlayer]:
         """Get player by ID"""
-        query = select(SessionPlayer).where(SessionPlayer.id == player_id)
-        result = await db.execute(query)
+        cache = _request_cache.get()
+        key = ("player", player_id)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        player = await db.get(SessionPlayer, player_id)
+
+        if cache is not None and player is not None:
+            cache[key] = player
+        return player
+
+    async def get_status(
+        self,
+        db: AsyncSession,
+        session_id: UUID
+    ) -> Optional[str]:
+        """
+        Get just a session's status without loading the full row
+
+        Args:
+            db: Database session
+            session_id: Session ID
+
+        Returns:
+            Status string or None if the session does not exist
+        """
+        cache = _request_cache.get()
+        if cache is not None:
+            session = cache.get(("session", session_id))
+            if session is not None:
+                return session.status
+
+        result = await db.execute(
+            select(GameSession.status).where(GameSession.id == session_id)
+        )
         return result.scalar_one_or_none()
-    
+
+    async def get_session_and_player(
+        self,
+        db: AsyncSession,
+        session_id: UUID,
+        player_id: UUID
+    ) -> Optional[Tuple[GameSession, SessionPlayer]]:
+        """
+        Get a session and one of its players in a single joined query
+
+        Replaces the get_by_id + get_player pair on the vote submission
+        path with one round-trip.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+            player_id: Player ID
+
+        Returns:
+            Tuple of (session, player), or None if either is missing
+        """
+        cache = _request_cache.get()
+        session_key = ("session", session_id)
+        player_key = ("player", player_id)
+        if cache is not None and session_key in cache and player_key in cache:
+            # The objects are cached independently, so re-check the
+            # membership the JOIN would have enforced: a cached player
+            # from another session must not validate against this one
+            cached_player = cache[player_key]
+            if cached_player.session_id != session_id:
+                return None
+            return cache[session_key], cached_player
+
+        query = (
+            select(GameSession, SessionPlayer)
+            .join(SessionPlayer, SessionPlayer.session_id == GameSession.id)
+            .where(
+                and_(
+                    GameSession.id == session_id,
+                    SessionPlayer.id == player_id
+                )
+            )
+        )
+        result = await db.execute(query)
+        row = result.first()
+        if row is None:
+            return None
+
+        session, player = row
+        if cache is not None:
+            cache[session_key] = session
+            cache[player_key] = player
+        return session, player
+
     async def get_player_by_user_id(
         self,
         db: AsyncSession,
@@ -269,20 +583,26 @@ class SessionRepository:
         user_id: UUID
     ) -> Optional[SessionPlayer]:
         """Get player by user ID in session"""
-        query = select(SessionPlayer).where(
-            and_(
-                SessionPlayer.session_id == session_id,
-                SessionPlayer.user_id == user_id
-            )
+        cache = _request_cache.get()
+        key = ("player_by_user", session_id, user_id)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        result = await db.execute(
+            _PLAYER_BY_USER, {"session_id": session_id, "user_id": user_id}
         )
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+        player = result.scalar_one_or_none()
+
+        if cache is not None and player is not None:
+            cache[key] = player
+            cache[("player", player.id)] = player
+        return player
     
     async def get_players(
         self,
         db: AsyncSession,
         session_id: UUID
-    ) -> List[SessionPlayer]:
+    ) -> Sequence[SessionPlayer]:
         """Get all players in session"""
         query = (
             select(SessionPlayer)
@@ -290,20 +610,49 @@ class SessionRepository:
             .order_by(SessionPlayer.joined_at)
         )
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
     
-    async def get_player_count(
+    async def get_players_core(
         self,
         db: AsyncSession,
         session_id: UUID
-    ) -> int:
-        """Get count of players in session"""
+    ) -> List[Dict[str, Any]]:
+        """
+        Get players as plain dicts, skipping ORM hydration
+
+        For read-only serialization paths (rosters, scoreboards): selects
+        only the needed columns and returns row mappings, with no identity
+        map or attribute instrumentation per row.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+
+        Returns:
+            Player dicts (id, user_id, nickname, is_organizer, joined_at)
+        """
         query = (
-            select(func.count())
-            .select_from(SessionPlayer)
+            select(
+                SessionPlayer.id,
+                SessionPlayer.user_id,
+                SessionPlayer.nickname,
+                SessionPlayer.is_organizer,
+                SessionPlayer.joined_at
+            )
             .where(SessionPlayer.session_id == session_id)
+            .order_by(SessionPlayer.joined_at)
         )
         result = await db.execute(query)
+        return [dict(row._mapping) for row in result]
+
+    async def get_player_count(
+        self,
+        db: AsyncSession,
+        session_id: UUID
+    ) -> int:
+        """Get count of players in session (denormalized counter read)"""
+        query = select(GameSession.player_count).where(GameSession.id == session_id)
+        result = await db.execute(query)
         return result.scalar() or 0
     
     # Vote methods
@@ -317,32 +666,107 @@ class SessionRepository:
         round_number: int,
         pair_index: int,
         weight: float = 1.0
-    ) -> Vote:
-        """Create a vote"""
-        vote = Vote(
-            session_id=session_id,
-            player_id=player_id,
-            item_id=item_id,
-            round_number=round_number,
-            pair_index=pair_index,
-            weight=weight
-        )
-        
-        db.add(vote)
-        await db.flush()
-        await db.refresh(vote)
-        
-        return vote
-    
+    ) -> Optional[Vote]:
+        """Create a vote; returns None if the player already voted on the pair"""
+        votes = await self.bulk_create_votes(db, [{
+            "session_id": session_id,
+            "player_id": player_id,
+            "item_id": item_id,
+            "round_number": round_number,
+            "pair_index": pair_index,
+            "weight": weight
+        }])
+        return votes[0] if votes else None
+
+    async def bulk_create_votes(
+        self,
+        db: AsyncSession,
+        rows: List[Dict[str, Any]]
+    ) -> List[Vote]:
+        """
+        Insert a batch of votes in a single multi-row statement
+
+        One round-trip instead of one per vote; duplicates (same player,
+        round and pair) are dropped server-side by the unique index via
+        ON CONFLICT DO NOTHING, and the RETURNING rows come back as Vote
+        instances.
+
+        Args:
+            db: Database session
+            rows: Vote column dicts (session_id, player_id, item_id,
+                round_number, pair_index, weight)
+
+        Returns:
+            Votes actually inserted (duplicates are skipped)
+        """
+        if not rows:
+            return []
+
+        stmt = pg_insert(Vote).values(rows).on_conflict_do_nothing(
+            index_elements=["session_id", "player_id", "round_number", "pair_index"]
+        ).returning(Vote)
+        result = await db.execute(stmt)
+        created = list(result.scalars())
+        await self._bump_vote_counts(db, [v.session_id for v in created])
+        return created
+
+    async def _bump_vote_counts(
+        self,
+        db: AsyncSession,
+        session_ids: List[UUID]
+    ) -> None:
+        """Increment the per-session vote counters for the given insertions"""
+        counts: Dict[UUID, int] = {}
+        for session_id in session_ids:
+            counts[session_id] = counts.get(session_id, 0) + 1
+
+        for session_id, n in counts.items():
+            await db.execute(
+                update(GameSession)
+                .where(GameSession.id == session_id)
+                .values(vote_count=GameSession.vote_count + n)
+            )
+        _bump_sessions_version()
+
     async def get_votes_for_pair(
         self,
         db: AsyncSession,
         session_id: UUID,
         round_number: int,
         pair_index: int
-    ) -> List[Vote]:
+    ) -> Sequence[Vote]:
         """Get all votes for a specific pair"""
-        query = select(Vote).where(
+        result = await db.execute(_VOTES_FOR_PAIR, {
+            "session_id": session_id,
+            "round_number": round_number,
+            "pair_index": pair_index
+        })
+        return result.scalars().all()
+    
+    async def get_votes_for_pair_core(
+        self,
+        db: AsyncSession,
+        session_id: UUID,
+        round_number: int,
+        pair_index: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Get votes for a pair as plain dicts, skipping ORM hydration
+
+        Read-only counterpart to get_votes_for_pair for tally/serialization
+        paths; the covering vote index satisfies this projection without
+        heap fetches.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+            round_number: Round number
+            pair_index: Pair index
+
+        Returns:
+            Vote dicts (player_id, item_id, weight)
+        """
+        query = select(Vote.player_id, Vote.item_id, Vote.weight).where(
             and_(
                 Vote.session_id == session_id,
                 Vote.round_number == round_number,
@@ -350,14 +774,91 @@ class SessionRepository:
             )
         )
         result = await db.execute(query)
-        return list(result.scalars().all())
-    
+        return [dict(row._mapping) for row in result]
+
+    async def get_pair_tally(
+        self,
+        db: AsyncSession,
+        session_id: UUID,
+        round_number: int,
+        pair_index: int
+    ) -> Dict[UUID, float]:
+        """
+        Get summed vote weights per item for a pair, aggregated server-side
+
+        Ships one number per item instead of every Vote row; with the
+        covering tally index this is an index-only scan plus GROUP BY.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+            round_number: Round number
+            pair_index: Pair index
+
+        Returns:
+            Mapping of item_id -> total vote weight
+        """
+        query = (
+            select(Vote.item_id, func.sum(Vote.weight).label("total"))
+            .where(
+                and_(
+                    Vote.session_id == session_id,
+                    Vote.round_number == round_number,
+                    Vote.pair_index == pair_index
+                )
+            )
+            .group_by(Vote.item_id)
+        )
+        result = await db.execute(query)
+        return {row.item_id: float(row.total) for row in result}
+
+    async def get_vote_counts_for_round(
+        self,
+        db: AsyncSession,
+        session_id: UUID,
+        round_number: int
+    ) -> Dict[int, Dict[UUID, float]]:
+        """
+        Get summed vote weights for every pair of a round in one query
+
+        One GROUP BY over (pair_index, item_id) replaces a per-pair tally
+        query when rendering round results.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+            round_number: Round number
+
+        Returns:
+            Mapping of pair_index -> {item_id: total vote weight}
+        """
+        query = (
+            select(
+                Vote.pair_index,
+                Vote.item_id,
+                func.sum(Vote.weight).label("total")
+            )
+            .where(
+                and_(
+                    Vote.session_id == session_id,
+                    Vote.round_number == round_number
+                )
+            )
+            .group_by(Vote.pair_index, Vote.item_id)
+        )
+        result = await db.execute(query)
+
+        counts: Dict[int, Dict[UUID, float]] = {}
+        for row in result:
+            counts.setdefault(row.pair_index, {})[row.item_id] = float(row.total)
+        return counts
+
     async def get_player_votes(
         self,
         db: AsyncSession,
         session_id: UUID,
         player_id: UUID
-    ) -> List[Vote]:
+    ) -> Sequence[Vote]:
         """Get all votes by a player in session"""
         query = select(Vote).where(
             and_(
@@ -367,19 +868,50 @@ class SessionRepository:
         ).order_by(Vote.created_at)
         
         result = await db.execute(query)
-        return list(result.scalars().all())
-    
+        return result.scalars().all()
+
+    async def stream_player_votes(
+        self,
+        db: AsyncSession,
+        session_id: UUID,
+        player_id: UUID
+    ) -> AsyncIterator[Vote]:
+        """
+        Stream a player's votes without materializing the full list
+
+        Rows arrive in server-side batches of 500 (yield_per), so long vote
+        histories can be pipelined straight into a streaming encoder.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+            player_id: Player ID
+
+        Yields:
+            Votes ordered by creation time
+        """
+        query = (
+            select(Vote)
+            .where(
+                and_(
+                    Vote.session_id == session_id,
+                    Vote.player_id == player_id
+                )
+            )
+            .order_by(Vote.created_at)
+            .execution_options(yield_per=500)
+        )
+        result = await db.stream(query)
+        async for vote in result.scalars():
+            yield vote
+
     async def get_total_votes(
         self,
         db: AsyncSession,
         session_id: UUID
     ) -> int:
-        """Get total number of votes in session"""
-        query = (
-            select(func.count())
-            .select_from(Vote)
-            .where(Vote.session_id == session_id)
-        )
+        """Get total number of votes in session (denormalized counter read)"""
+        query = select(GameSession.vote_count).where(GameSession.id == session_id)
         result = await db.execute(query)
         return result.scalar() or 0
     
@@ -402,7 +934,6 @@ class SessionRepository:
         
         db.add(session_round)
         await db.flush()
-        await db.refresh(session_round)
         
         return session_round
     
@@ -413,20 +944,112 @@ class SessionRepository:
         round_number: int
     ) -> Optional[SessionRound]:
         """Get specific round"""
-        query = select(SessionRound).where(
-            and_(
-                SessionRound.session_id == session_id,
-                SessionRound.round_number == round_number
+        cache = _request_cache.get()
+        key = ("round", session_id, round_number)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        result = await db.execute(
+            _ROUND_BY_NUM, {"session_id": session_id, "round_number": round_number}
+        )
+        session_round = result.scalar_one_or_none()
+
+        if cache is not None and session_round is not None:
+            cache[key] = session_round
+        return session_round
+    
+    async def get_last_round(
+        self,
+        db: AsyncSession,
+        session_id: UUID
+    ) -> Optional[SessionRound]:
+        """
+        Get the most recent round for a session
+
+        Fetches one row via ORDER BY round_number DESC LIMIT 1 instead of
+        materializing every round just to find the latest.
+
+        Args:
+            db: Database session
+            session_id: Session ID
+
+        Returns:
+            Latest round or None
+        """
+        query = (
+            select(SessionRound)
+            .where(SessionRound.session_id == session_id)
+            .order_by(SessionRound.round_number.desc())
+            .limit(1)
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_open_pair(
+        self,
+        db: AsyncSession,
+        round_id: UUID
+    ) -> Optional[SessionRoundPair]:
+        """
+        Get the next undecided pair of a round via an indexed point read
+
+        Served by the partial index on open pairs, so the database answers
+        without touching the round_data JSON blob.
+
+        Args:
+            db: Database session
+            round_id: Round ID
+
+        Returns:
+            First pair without a winner, or None if the round is decided
+        """
+        query = (
+            select(SessionRoundPair)
+            .where(
+                and_(
+                    SessionRoundPair.round_id == round_id,
+                    SessionRoundPair.winner_id.is_(None)
+                )
             )
+            .order_by(SessionRoundPair.pair_index)
+            .limit(1)
         )
         result = await db.execute(query)
         return result.scalar_one_or_none()
-    
+
+    async def count_open_pairs(
+        self,
+        db: AsyncSession,
+        round_id: UUID
+    ) -> int:
+        """
+        Count pairs of a round that still have no winner
+
+        Args:
+            db: Database session
+            round_id: Round ID
+
+        Returns:
+            Number of undecided pairs
+        """
+        query = (
+            select(func.count())
+            .select_from(SessionRoundPair)
+            .where(
+                and_(
+                    SessionRoundPair.round_id == round_id,
+                    SessionRoundPair.winner_id.is_(None)
+                )
+            )
+        )
+        result = await db.execute(query)
+        return result.scalar() or 0
+
     async def get_all_rounds(
         self,
         db: AsyncSession,
         session_id: UUID
-    ) -> List[SessionRound]:
+    ) -> Sequence[SessionRound]:
         """Get all rounds for session"""
         query = (
             select(SessionRound)
@@ -434,7 +1057,7 @@ class SessionRepository:
             .order_by(SessionRound.round_number)
         )
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
     
     async def update_round(
         self,
@@ -443,17 +1066,25 @@ class SessionRepository:
         **kwargs
     ) -> SessionRound:
         """Update a round"""
-        for key, value in kwargs.items():
-            if hasattr(session_round, key):
-                setattr(session_round, key, value)
-        
-        await db.flush()
-        await db.refresh(session_round)
-        
-        return session_round
-    
+        values = {k: v for k, v in kwargs.items() if k in self._ROUND_UPDATABLE}
+
+        stmt = (
+            update(SessionRound)
+            .where(SessionRound.id == session_round.id)
+            .values(**values)
+            .returning(SessionRound)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        updated = result.scalar_one()
+
+        cache = _request_cache.get()
+        if cache is not None:
+            cache[("round", updated.session_id, updated.round_number)] = updated
+        return updated
+
     # Aggregate methods
-    
+
     async def get_active_session_count(
         self,
         db: AsyncSession,
@@ -3,6 +3,7 @@ Tournament Game Backend - Session Service
 Business logic for game session management
 """
 import logging
+import time
 from typing import List, Optional, Tuple, Dict, Any
 from uuid import UUID
 from datetime import datetime, timedelta
@@ -14,7 +15,7 @@ from src.config import settings
 from src.core.security import generate_session_code
 from src.modules.session.models import GameSession, SessionPlayer, Vote, SessionRound
 from src.modules.session.repository import SessionRepository
-from src.modules.session.voting_engine import voting_engine
+from src.modules.session.voting_engine import voting_engine, cached_uuid
 from src.modules.session.tournament import tournament_manager
 from src.modules.competition.service import competition_service
 from src.modules.session.exceptions import (
@@ -28,6 +29,24 @@ from src.modules.session.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Short-TTL cache for vote-count polls. During active voting every client
+# polls the same (session, round, pair) tally, so a few hundred
+# milliseconds of staleness collapses that herd into one aggregation
+# query per interval. Entries are dropped on vote submission; the bound
+# keeps the dict from growing without limit in a long-lived process.
+_VOTE_COUNTS_TTL = 0.3
+_VOTE_COUNTS_CACHE_MAX = 1024
+_vote_counts_cache: Dict[Tuple[UUID, int, int], Tuple[float, Dict[str, int]]] = {}
+
+
+def _serialize_item(item) -> Dict[str, Any]:
+    """Shared item -> response dict shape used across session payloads"""
+    return {
+        "id": str(item.id),
+        "name": item.name,
+        "image_url": item.image_url
+    }
+
 
 class SessionService:
     """Service class for game session business logic"""
@@ -36,6 +55,12 @@ class SessionService:
         self.repository = SessionRepository()
         self.voting_engine = voting_engine
         self.tournament = tournament_manager
+        # Bind hot config values once; instance attribute reads are
+        # cheaper than the settings attribute chain on every call
+        self._min_items = settings.MIN_ITEMS_PER_COMPETITION
+        self._min_players = settings.MIN_PLAYERS_PER_SESSION
+        self._max_players = settings.MAX_PLAYERS_PER_SESSION
+        self._code_length = settings.SESSION_CODE_LENGTH
     
     async def create_session(
         self,
@@ -58,34 +83,29 @@ class SessionService:
         """
         # Verify competition exists and has enough items
         competition = await competition_service.get_competition_with_items(db, competition_id)
-        if competition["item_count"] < settings.MIN_ITEMS_PER_COMPETITION:
+        if competition["item_count"] < self._min_items:
             raise InvalidSessionStateError(
-                f"Competition must have at least {settings.MIN_ITEMS_PER_COMPETITION} items"
+                f"Competition must have at least {self._min_items} items"
             )
         
-        # Generate unique session code
-        max_attempts = 10
-        session_code = None
-        
-        for _ in range(max_attempts):
-            code = generate_session_code(settings.SESSION_CODE_LENGTH)
-            existing = await self.repository.get_by_code(db, code)
-            if not existing:
-                session_code = code
+        # Insert optimistically: collisions on a random code are rare, so
+        # let ON CONFLICT DO NOTHING detect them instead of probing first
+        session = None
+        for _ in range(3):
+            code = generate_session_code(self._code_length)
+            session = await self.repository.create(
+                db=db,
+                code=code,
+                competition_id=competition_id,
+                organizer_id=organizer_id,
+                organizer_name=organizer_name
+            )
+            if session:
                 break
-        
-        if not session_code:
+
+        if not session:
             raise SessionAlreadyExistsError("Failed to generate unique session code")
-        
-        # Create session
-        session = await self.repository.create(
-            db=db,
-            code=session_code,
-            competition_id=competition_id,
-            organizer_id=organizer_id,
-            organizer_name=organizer_name
-        )
-        
+
         # Add organizer as first player
         if organizer_id:
             await self.repository.add_player(
@@ -96,7 +116,7 @@ class SessionService:
                 is_organizer=True
             )
         
-        logger.info(f"Created session {session_code} for competition {competition_id}")
+        logger.info(f"Created session {session.code} for competition {competition_id}")
         return session
     
     async def get_session_by_code(
@@ -156,20 +176,19 @@ class SessionService:
             if existing:
                 raise PlayerAlreadyJoinedError("You have already joined this session")
         
-        # Check player limit
-        player_count = await self.repository.get_player_count(db, session_id)
-        if player_count >= settings.MAX_PLAYERS_PER_SESSION:
-            raise SessionFullError("Session is full")
-        
-        # Add player
-        player = await self.repository.add_player(
+        # Add player; the capacity check happens atomically in the insert
+        # path, so concurrent joiners cannot overflow the limit
+        player = await self.repository.add_player_if_space(
             db=db,
             session_id=session_id,
             user_id=user_id,
             nickname=player_name,
+            max_players=self._max_players,
             is_organizer=False
         )
-        
+        if player is None:
+            raise SessionFullError("Session is full")
+
         logger.info(f"Player {player_name} joined session {session.code}")
         return player
     
@@ -195,11 +214,11 @@ class SessionService:
         if session.status != "waiting":
             raise InvalidSessionStateError("Session already started")
         
-        # Check minimum players
-        player_count = await self.repository.get_player_count(db, session_id)
-        if player_count < settings.MIN_PLAYERS_PER_SESSION:
+        # Check minimum players from the denormalized counter on the row
+        # we already hold - no extra query
+        if session.player_count < self._min_players:
             raise InvalidSessionStateError(
-                f"Need at least {settings.MIN_PLAYERS_PER_SESSION} players to start"
+                f"Need at least {self._min_players} players to start"
             )
         
         # Get competition items
@@ -214,13 +233,16 @@ class SessionService:
             items=competition["items"]
         )
         
-        # Update session status
-        session.status = "in_progress"
-        session.started_at = datetime.utcnow()
-        session.current_round = 1
-        
-        await db.flush()
-        
+        # Update session status with a DB-side start timestamp; RETURNING
+        # repopulates the instance so started_at is a real datetime
+        session = await self.repository.update(
+            db,
+            session,
+            status="in_progress",
+            started_at=func.now(),
+            current_round=1
+        )
+
         logger.info(f"Started session {session.code}")
         return session
     
@@ -234,19 +256,19 @@ class SessionService:
         pair_index: int
     ) -> Vote:
         """Submit a vote"""
-        # Get session and verify it's in progress
-        session = await self.repository.get_by_id(db, session_id)
-        if not session:
-            raise SessionNotFoundError("Session not found")
-        
+        # Load session and player together in one round-trip
+        pair = await self.repository.get_session_and_player(db, session_id, player_id)
+        if pair is None:
+            # Distinguish a missing session from a missing player only on
+            # the error path
+            if not await self.repository.get_by_id(db, session_id):
+                raise SessionNotFoundError("Session not found")
+            raise InvalidVoteError("Player not found in session")
+
+        session, player = pair
         if session.status != "in_progress":
             raise InvalidSessionStateError("Session is not in progress")
-        
-        # Get player
-        player = await self.repository.get_player(db, player_id)
-        if not player or player.session_id != session_id:
-            raise InvalidVoteError("Player not found in session")
-        
+
         # Cast vote
         vote = await self.voting_engine.cast_vote(
             db=db,
@@ -257,7 +279,20 @@ class SessionService:
             pair_index=pair_index,
             is_organizer=player.is_organizer
         )
-        
+
+        # Fold the new vote into the cached tally so the broadcast that
+        # follows a submission reads a dict instead of re-aggregating.
+        # Cold caches stay cold and fall through to the SQL aggregate.
+        entry = _vote_counts_cache.get((session_id, round_number, pair_index))
+        if entry is not None:
+            counts = entry[1]
+            key = str(item_id)
+            if key in counts:
+                counts[key] += vote.weight
+                _vote_counts_cache[(session_id, round_number, pair_index)] = (
+                    time.monotonic(), counts
+                )
+
         return vote
     
     async def get_vote_counts(
@@ -265,31 +300,44 @@ class SessionService:
         db: AsyncSession,
         session_id: UUID,
         round_number: int,
-        pair_index: int
+        pair_index: int,
+        *,
+        round_obj: Optional[SessionRound] = None
     ) -> Dict[str, int]:
         """Get current vote counts for a pair"""
-        votes = await self.repository.get_votes_for_pair(
+        cache_key = (session_id, round_number, pair_index)
+        entry = _vote_counts_cache.get(cache_key)
+        if entry is not None and time.monotonic() - entry[0] < _VOTE_COUNTS_TTL:
+            return entry[1]
+
+        # Aggregate server-side: one number per item instead of N vote rows
+        tally = await self.repository.get_pair_tally(
             db, session_id, round_number, pair_index
         )
-        
-        # Get the current round to find the pair
-        current_round = await self.repository.get_round(db, session_id, round_number)
+
+        # Use the caller's round object when provided; otherwise the
+        # lookup is served from the per-request cache after the first hit
+        current_round = round_obj
+        if current_round is None:
+            current_round = await self.repository.get_round(db, session_id, round_number)
         if not current_round:
             return {}
-        
+
         # Get item IDs from the pair
         pairs = current_round.round_data.get("pairs", [])
         if pair_index >= len(pairs):
             return {}
-        
+
         pair = pairs[pair_index]
-        item_ids = [UUID(pair["item1"]), UUID(pair["item2"])]
-        
-        # Calculate vote counts
-        vote_counts = await self.voting_engine.get_vote_counts(votes, item_ids)
-        
-        # Convert UUIDs to strings for JSON
-        return {str(k): v for k, v in vote_counts.items()}
+        item_ids = [cached_uuid(pair["item1"]), cached_uuid(pair["item2"])]
+
+        # Items with no votes yet still appear with a zero count
+        counts = {str(item_id): tally.get(item_id, 0.0) for item_id in item_ids}
+
+        if len(_vote_counts_cache) >= _VOTE_COUNTS_CACHE_MAX:
+            _vote_counts_cache.clear()
+        _vote_counts_cache[cache_key] = (time.monotonic(), counts)
+        return counts
     
     async def get_pair_voters(
         self,
@@ -297,9 +345,14 @@ class SessionService:
         session_id: UUID,
         round_number: int,
         pair_index: int
-    ) -> List[Vote]:
-        """Get list of players who voted for a pair"""
-        return await self.repository.get_votes_for_pair(
+    ) -> List[Dict[str, Any]]:
+        """
+        Get list of players who voted for a pair
+
+        Returns Core row dicts rather than ORM Vote instances - callers only
+        serialize these, so hydration would be wasted work.
+        """
+        return await self.repository.get_votes_for_pair_core(
             db, session_id, round_number, pair_index
         )
     
@@ -340,13 +393,16 @@ class SessionService:
         
         if not round_obj:
             return None
-        
+
+        current_index, total_pairs, remaining = self._summarize_round(
+            round_obj.round_data
+        )
         return {
             "round_number": round_obj.round_number,
             "total_rounds": session.total_rounds or 0,
-            "current_pair_index": await self._get_current_pair_index(round_obj),
-            "total_pairs": len(round_obj.round_data.get("pairs", [])),
-            "remaining_items": await self._count_remaining_items(round_obj)
+            "current_pair_index": current_index,
+            "total_pairs": total_pairs,
+            "remaining_items": remaining
         }
     
     async def get_current_pair(
@@ -366,28 +422,24 @@ class SessionService:
         if not current_round:
             return None
         
-        pair_data = await self.tournament.get_current_pair(current_round)
+        pair_data = self.tournament.get_current_pair(current_round)
         if not pair_data:
             return None
         
-        # Get item details
-        item1 = await competition_service.get_item_by_id(db, pair_data["item1_id"])
-        item2 = await competition_service.get_item_by_id(db, pair_data["item2_id"])
-        
+        # Get both item details in a single round-trip
+        items = await competition_service.get_items_by_ids(
+            db, [pair_data["item1_id"], pair_data["item2_id"]]
+        )
+        by_id = {item.id: item for item in items}
+        item1 = by_id[pair_data["item1_id"]]
+        item2 = by_id[pair_data["item2_id"]]
+
         return {
             "round_number": pair_data["round_number"],
             "pair_index": pair_data["pair_index"],
             "total_pairs": pair_data["total_pairs"],
-            "item1": {
-                "id": str(item1.id),
-                "name": item1.name,
-                "image_url": item1.image_url
-            },
-            "item2": {
-                "id": str(item2.id),
-                "name": item2.name,
-                "image_url": item2.image_url
-            }
+            "item1": _serialize_item(item1),
+            "item2": _serialize_item(item2)
         }
     
     async def complete_pair_voting(
@@ -425,7 +477,7 @@ class SessionService:
             return None
         
         # Get next incomplete pair
-        return await self.tournament.get_current_pair(current_round)
+        return self.tournament.get_current_pair(current_round)
     
     async def is_round_complete(
         self,
@@ -444,7 +496,7 @@ class SessionService:
         if not current_round:
             return False
         
-        return await self.tournament.is_round_complete(current_round)
+        return self.tournament.is_round_complete(current_round)
     
     async def complete_round(
         self,
@@ -471,14 +523,7 @@ class SessionService:
             db, result["winners"]
         )
         
-        result["winners"] = [
-            {
-                "id": str(item.id),
-                "name": item.name,
-                "image_url": item.image_url
-            }
-            for item in winner_items
-        ]
+        result["winners"] = [_serialize_item(item) for item in winner_items]
         
         return result
     
@@ -500,13 +545,16 @@ class SessionService:
         if not current_round:
             return False
         
-        winners = await self.tournament.get_round_winners(current_round.round_data)
+        winners = self.tournament.get_round_winners(current_round)
         
         if len(winners) <= 1:
-            # Tournament is complete
-            session.status = "completed"
-            session.completed_at = datetime.utcnow()
-            await db.flush()
+            # Tournament is complete; timestamp comes from the database
+            await self.repository.update(
+                db,
+                session,
+                status="completed",
+                completed_at=func.now()
+            )
             return False
         
         # Create next round
@@ -530,8 +578,8 @@ class SessionService:
         session_id: UUID
     ) -> bool:
         """Check if session is complete"""
-        session = await self.repository.get_by_id(db, session_id)
-        return session and session.status == "completed"
+        status = await self.repository.get_status(db, session_id)
+        return status == "completed"
     
     async def get_final_results(
         self,
@@ -547,11 +595,12 @@ class SessionService:
         rounds = await self.repository.get_all_rounds(db, session_id)
         
         # Generate bracket
-        bracket = await self.tournament.generate_bracket(db, session_id, rounds)
+        bracket = self.tournament.generate_bracket(db, session_id, rounds)
         
-        # Find winner from last round
-        last_round = max(rounds, key=lambda r: r.round_number)
-        winners = await self.tournament.get_round_winners(last_round.round_data)
+        # get_all_rounds orders by round_number, so the last element is
+        # the final round - no scan needed
+        last_round = rounds[-1]
+        winners = self.tournament.get_round_winners(last_round)
         
         winner_item = None
         if winners:
@@ -563,15 +612,12 @@ class SessionService:
             duration = session.completed_at - session.started_at
             duration_seconds = int(duration.total_seconds())
         
-        # Count total votes
-        total_votes = await self.repository.get_total_votes(db, session_id)
-        
+        # Total votes come from the denormalized counter already loaded
+        # with the session row
+        total_votes = session.vote_count
+
         return {
-            "winner": {
-                "id": str(winner_item.id),
-                "name": winner_item.name,
-                "image_url": winner_item.image_url
-            } if winner_item else None,
+            "winner": _serialize_item(winner_item) if winner_item else None,
             "bracket": bracket,
             "total_rounds": session.total_rounds or len(rounds),
             "total_votes": total_votes,
@@ -608,19 +654,29 @@ class SessionService:
         await self.repository.delete(db, session)
         return True
     
-    async def _get_current_pair_index(self, round_obj: SessionRound) -> int:
-        """Get index of current pair being voted on"""
-        pairs = round_obj.round_data.get("pairs", [])
+    @staticmethod
+    def _summarize_round(round_data: Dict[str, Any]) -> Tuple[int, int, int]:
+        """
+        Compute round progress in a single pass over the pairs
+
+        Returns:
+            Tuple of (current_pair_index, total_pairs, remaining_items),
+            where remaining_items counts decided winners plus the bye item
+        """
+        pairs = round_data.get("pairs", [])
+        current_index = len(pairs)
+        remaining = 0
         for i, pair in enumerate(pairs):
-            if not pair.get("winner"):
-                return i
-        return len(pairs)
-    
-    async def _count_remaining_items(self, round_obj: SessionRound) -> int:
-        """Count items still in the tournament"""
-        winners = await self.tournament.get_round_winners(round_obj.round_data)
-        return len(winners)
-    
+            if pair.get("winner"):
+                remaining += 1
+            elif current_index == len(pairs):
+                current_index = i
+
+        if round_data.get("bye_item"):
+            remaining += 1
+
+        return current_index, len(pairs), remaining
+
     async def get_session_item_count(
         self,
         db: AsyncSession,
@@ -630,11 +686,9 @@ class SessionService:
         session = await self.repository.get_by_id(db, session_id)
         if not session:
             return 0
-        
-        competition = await competition_service.get_competition_with_items(
-            db, session.competition_id
-        )
-        return competition["item_count"]
+
+        # Scalar COUNT instead of hydrating the competition and its items
+        return await competition_service.get_item_count(db, session.competition_id)
     
     def calculate_total_rounds(self, item_count: int) -> int:
         """Calculate total rounds needed for tournament"""
@@ -651,35 +705,46 @@ class SessionService:
         if not round_obj:
             raise InvalidSessionStateError("Round not found")
         
-        # Get detailed results
+        round_pairs = round_obj.round_data.get("pairs", [])
+
+        # Batch the lookups: one fetch for every item in the round and one
+        # GROUP BY for all pair tallies, instead of 2 item queries plus a
+        # tally query per pair
+        item_ids = set()
+        for pair_data in round_pairs:
+            item_ids.add(cached_uuid(pair_data["item1"]))
+            item_ids.add(cached_uuid(pair_data["item2"]))
+
+        items = await competition_service.get_items_by_ids(db, list(item_ids))
+        items_by_id = {item.id: item for item in items}
+
+        round_tallies = await self.repository.get_vote_counts_for_round(
+            db, session_id, round_number
+        )
+
         pairs = []
-        for i, pair_data in enumerate(round_obj.round_data.get("pairs", [])):
-            item1 = await competition_service.get_item_by_id(db, UUID(pair_data["item1"]))
-            item2 = await competition_service.get_item_by_id(db, UUID(pair_data["item2"]))
-            
+        for i, pair_data in enumerate(round_pairs):
+            item1 = items_by_id[cached_uuid(pair_data["item1"])]
+            item2 = items_by_id[cached_uuid(pair_data["item2"])]
+
             pair_info = {
                 "pair_index": i,
-                "item1": {
-                    "id": str(item1.id),
-                    "name": item1.name,
-                    "image_url": item1.image_url
-                },
-                "item2": {
-                    "id": str(item2.id),
-                    "name": item2.name,
-                    "image_url": item2.image_url
-                },
+                "item1": _serialize_item(item1),
+                "item2": _serialize_item(item2),
                 "winner_id": pair_data.get("winner"),
                 "completed": pair_data.get("winner") is not None
             }
-            
-            # Get vote counts if completed
+
+            # Attach vote counts if completed
             if pair_data.get("winner"):
-                votes = await self.get_vote_counts(db, session_id, round_number, i)
-                pair_info["vote_counts"] = votes
-            
+                tally = round_tallies.get(i, {})
+                pair_info["vote_counts"] = {
+                    str(item.id): tally.get(item.id, 0.0)
+                    for item in (item1, item2)
+                }
+
             pairs.append(pair_info)
-        
+
         return {
             "round_number": round_number,
             "total_pairs": len(pairs),
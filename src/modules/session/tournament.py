@@ -3,25 +3,40 @@ Tournament Game Backend - Tournament Logic
 Handles tournament bracket generation and progression
 """
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import time
+from operator import attrgetter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
+from sqlalchemy import func, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.modules.session.models import SessionRound, GameSession
+from src.modules.session.models import SessionRound, SessionRoundPair, GameSession
 from src.modules.competition.models import CompetitionItem
-from src.modules.session.voting_engine import voting_engine
+from src.modules.session.voting_engine import voting_engine, cached_uuid
 
 logger = logging.getLogger(__name__)
 
+# Display names for the last rounds, keyed by distance from the final
+_ROUND_NAMES = {0: "Final", 1: "Semi-Final", 2: "Quarter-Final"}
+
+
+class RoundScan(NamedTuple):
+    """Single-pass summary of a round's pairs, cached on the round"""
+    winners: List[UUID]
+    first_incomplete: int
+    all_complete: bool
+    pair_count: int
+
 
 class TournamentManager:
-    """Manages tournament bracket and progression"""
-    
-    def __init__(self):
-        self.voting_engine = voting_engine
-    
+    """Manages tournament bracket and progression
+
+    Holds no per-instance state; methods use the module-level
+    voting_engine directly rather than rebinding it on the instance.
+    """
+
     async def initialize_tournament(
         self,
         db: AsyncSession,
@@ -40,7 +55,7 @@ class TournamentManager:
             First round object
         """
         # Calculate tournament structure
-        total_rounds = self.voting_engine.calculate_total_rounds(len(items))
+        total_rounds = voting_engine.calculate_total_rounds(len(items))
         
         # Update session with total rounds
         session.total_rounds = total_rounds
@@ -76,17 +91,21 @@ class TournamentManager:
             Created round
         """
         # Generate pairs
-        pairs = self.voting_engine.generate_pairs(items, shuffle=True)
+        pairs = voting_engine.generate_pairs(items, shuffle=True)
         
         # Find bye item if odd number
         paired_items = {item for pair in pairs for item in pair}
-        bye_item = self.voting_engine.get_bye_item(items, paired_items)
+        bye_item = voting_engine.get_bye_item(items, paired_items)
         
         # Create round record
         round_data = {
             "pairs": [{"item1": str(pair[0]), "item2": str(pair[1])} for pair in pairs],
             "bye_item": str(bye_item) if bye_item else None,
-            "total_pairs": len(pairs)
+            "total_pairs": len(pairs),
+            # One bit per pair; bit i set means pair i is decided, and
+            # full_mask is the value the mask reaches when all are
+            "completed_mask": 0,
+            "full_mask": (1 << len(pairs)) - 1
         }
         
         session_round = SessionRound(
@@ -98,35 +117,84 @@ class TournamentManager:
         
         db.add(session_round)
         await db.flush()
-        
+
+        # Normalized pair rows so resolving a pair is a single-row
+        # UPDATE; one multi-row INSERT regardless of pair count
+        if pairs:
+            await db.execute(
+                insert(SessionRoundPair).values([
+                    {
+                        "round_id": session_round.id,
+                        "pair_index": i,
+                        "item1_id": pair[0],
+                        "item2_id": pair[1]
+                    }
+                    for i, pair in enumerate(pairs)
+                ])
+            )
+
         logger.info(f"Created round {round_number} with {len(pairs)} pairs")
         return session_round
     
-    async def get_round_winners(
+    def _scan_round(self, session_round: SessionRound) -> RoundScan:
+        """
+        Summarize a round's pairs in one pass and cache the result
+
+        Winners, the first undecided index and completeness are usually
+        requested together, so they are computed in a single scan and
+        stashed on the round instance; update_pair_result drops the
+        cached scan when a pair is decided.
+
+        Args:
+            session_round: Round to summarize
+
+        Returns:
+            Cached RoundScan for the round
+        """
+        scan = session_round.__dict__.get("_round_scan")
+        if scan is not None:
+            return scan
+
+        round_data = session_round.round_data
+        pairs = round_data.get("pairs", [])
+
+        # Comprehension appends in C; the walrus binds each winner once
+        winners = [
+            cached_uuid(winner)
+            for pair in pairs
+            if (winner := pair.get("winner"))
+        ]
+        all_complete = len(winners) == len(pairs)
+        first_incomplete = len(pairs) if all_complete else next(
+            i for i, pair in enumerate(pairs) if not pair.get("winner")
+        )
+
+        if (bye := round_data.get("bye_item")):
+            winners.append(cached_uuid(bye))
+
+        scan = RoundScan(
+            winners=winners,
+            first_incomplete=first_incomplete,
+            all_complete=all_complete,
+            pair_count=len(pairs)
+        )
+        session_round.__dict__["_round_scan"] = scan
+        return scan
+
+    def get_round_winners(
         self,
-        round_data: Dict[str, Any]
+        session_round: SessionRound
     ) -> List[UUID]:
         """
-        Get all winners from a completed round
-        
+        Get all winners from a completed round, bye item included
+
         Args:
-            round_data: Round data with results
-            
+            session_round: Round with results
+
         Returns:
             List of winner item IDs
         """
-        winners = []
-        
-        # Add winners from pairs
-        for pair in round_data.get("pairs", []):
-            if pair.get("winner"):
-                winners.append(UUID(pair["winner"]))
-        
-        # Add bye item if exists
-        if round_data.get("bye_item"):
-            winners.append(UUID(round_data["bye_item"]))
-        
-        return winners
+        return self._scan_round(session_round).winners
     
     async def complete_round(
         self,
@@ -148,7 +216,7 @@ class TournamentManager:
         session_round.completed_at = datetime.utcnow()
         
         # Get winners
-        winners = await self.get_round_winners(session_round.round_data)
+        winners = self.get_round_winners(session_round)
         
         # Calculate if there's a next round
         has_next_round = len(winners) > 1
@@ -186,19 +254,37 @@ class TournamentManager:
         """
         if pair_index >= len(session_round.round_data.get("pairs", [])):
             return False
-        
-        # Update the pair with winner
+
+        # Single-row UPDATE of the normalized pair record; the server
+        # clock stamps the row, no Python datetime on the write path
+        await db.execute(
+            update(SessionRoundPair)
+            .where(
+                SessionRoundPair.round_id == session_round.id,
+                SessionRoundPair.pair_index == pair_index
+            )
+            .values(winner_id=winner_id, completed_at=func.now())
+        )
+
+        # Update the pair with winner; the JSON copy keeps a raw
+        # nanosecond epoch, formatted only if a display path needs it
         session_round.round_data["pairs"][pair_index]["winner"] = str(winner_id)
-        session_round.round_data["pairs"][pair_index]["completed_at"] = datetime.utcnow().isoformat()
-        
+        session_round.round_data["pairs"][pair_index]["completed_ns"] = time.time_ns()
+        session_round.round_data["completed_mask"] = (
+            session_round.round_data.get("completed_mask", 0) | (1 << pair_index)
+        )
+
         # Mark round data as modified for SQLAlchemy to detect change
         from sqlalchemy.orm.attributes import flag_modified
         flag_modified(session_round, "round_data")
-        
+
+        # The cached scan is stale now that a pair is decided
+        session_round.__dict__.pop("_round_scan", None)
+
         await db.flush()
         return True
     
-    async def generate_bracket(
+    def generate_bracket(
         self,
         db: AsyncSession,
         session_id: UUID,
@@ -219,34 +305,34 @@ class TournamentManager:
             "rounds": [],
             "total_rounds": len(rounds)
         }
-        
-        for round_obj in sorted(rounds, key=lambda r: r.round_number):
+
+        for round_obj in sorted(rounds, key=attrgetter("round_number")):
             round_info = {
                 "round_number": round_obj.round_number,
                 "status": round_obj.status,
-                "pairs": []
+                # Comprehension builds the pair dicts in one C-level pass;
+                # the walrus binds winner once instead of two lookups
+                "pairs": [
+                    {
+                        "index": i,
+                        "item1_id": pair_data["item1"],
+                        "item2_id": pair_data["item2"],
+                        "winner_id": (winner := pair_data.get("winner")),
+                        "completed": winner is not None
+                    }
+                    for i, pair_data in enumerate(round_obj.round_data.get("pairs", []))
+                ]
             }
-            
-            # Add pair information
-            for i, pair_data in enumerate(round_obj.round_data.get("pairs", [])):
-                pair_info = {
-                    "index": i,
-                    "item1_id": pair_data["item1"],
-                    "item2_id": pair_data["item2"],
-                    "winner_id": pair_data.get("winner"),
-                    "completed": pair_data.get("winner") is not None
-                }
-                round_info["pairs"].append(pair_info)
-            
+
             # Add bye item if exists
             if round_obj.round_data.get("bye_item"):
                 round_info["bye_item"] = round_obj.round_data["bye_item"]
-            
+
             bracket["rounds"].append(round_info)
-        
+
         return bracket
     
-    async def get_current_pair(
+    def get_current_pair(
         self,
         session_round: SessionRound
     ) -> Optional[Dict[str, Any]]:
@@ -259,22 +345,40 @@ class TournamentManager:
         Returns:
             Current pair data or None if round complete
         """
-        pairs = session_round.round_data.get("pairs", [])
-        
-        # Find first incomplete pair
-        for i, pair in enumerate(pairs):
-            if not pair.get("winner"):
-                return {
-                    "round_number": session_round.round_number,
-                    "pair_index": i,
-                    "item1_id": UUID(pair["item1"]),
-                    "item2_id": UUID(pair["item2"]),
-                    "total_pairs": len(pairs)
-                }
-        
-        return None
+        round_data = session_round.round_data
+        mask = round_data.get("completed_mask")
+        if mask is not None:
+            # Lowest unset bit is the next pair: isolate it with
+            # open & -open, no loop over the pairs
+            total_pairs = round_data["total_pairs"]
+            full = round_data.get("full_mask", (1 << total_pairs) - 1)
+            open_bits = ~mask & full
+            if not open_bits:
+                return None
+            index = (open_bits & -open_bits).bit_length() - 1
+            return {
+                "round_number": session_round.round_number,
+                "pair_index": index,
+                "item1_id": cached_uuid(round_data["pairs"][index]["item1"]),
+                "item2_id": cached_uuid(round_data["pairs"][index]["item2"]),
+                "total_pairs": total_pairs
+            }
+        else:
+            # Rounds created before the mask existed
+            scan = self._scan_round(session_round)
+            if scan.first_incomplete >= scan.pair_count:
+                return None
+            index = scan.first_incomplete
+            pair = round_data["pairs"][index]
+            return {
+                "round_number": session_round.round_number,
+                "pair_index": index,
+                "item1_id": cached_uuid(pair["item1"]),
+                "item2_id": cached_uuid(pair["item2"]),
+                "total_pairs": scan.pair_count
+            }
     
-    async def is_round_complete(
+    def is_round_complete(
         self,
         session_round: SessionRound
     ) -> bool:
@@ -287,8 +391,14 @@ class TournamentManager:
         Returns:
             True if all pairs have winners
         """
-        pairs = session_round.round_data.get("pairs", [])
-        return all(pair.get("winner") for pair in pairs)
+        round_data = session_round.round_data
+        mask = round_data.get("completed_mask")
+        if mask is not None:
+            full = round_data.get(
+                "full_mask", (1 << round_data["total_pairs"]) - 1
+            )
+            return mask == full
+        return self._scan_round(session_round).all_complete
     
     def get_round_name(self, round_number: int, total_rounds: int) -> str:
         """
@@ -301,16 +411,8 @@ class TournamentManager:
         Returns:
             Round name (e.g., "Quarter-Final", "Final")
         """
-        rounds_from_end = total_rounds - round_number
-        
-        if rounds_from_end == 0:
-            return "Final"
-        elif rounds_from_end == 1:
-            return "Semi-Final"
-        elif rounds_from_end == 2:
-            return "Quarter-Final"
-        else:
-            return f"Round {round_number}"
+        name = _ROUND_NAMES.get(total_rounds - round_number)
+        return name if name is not None else f"Round {round_number}"
 
 
 # Create tournament manager instance
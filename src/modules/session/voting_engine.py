@@ -3,13 +3,17 @@ Tournament Game Backend - Voting Engine
 Core voting logic and tournament progression
 """
 import logging
+from functools import lru_cache
+from random import Random
 from typing import Dict, List, Optional, Tuple, Set
 from uuid import UUID
-from collections import defaultdict
 
+from sqlalchemy import bindparam, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.modules.session.models import Vote, SessionRound
+from src.modules.session.models import GameSession, Vote, SessionRound
+from src.modules.session.repository import _bump_sessions_version
 from src.modules.session.exceptions import (
     InvalidVoteError,
     VotingNotAllowedError,
@@ -18,6 +22,24 @@ from src.modules.session.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# round_data stores item IDs as canonical UUID strings, and the polling
+# paths re-parse the same handful of strings on every call. UUIDs are
+# immutable, so a bounded memo makes the repeat conversions dict hits.
+cached_uuid = lru_cache(maxsize=4096)(UUID)
+
+# Engine-owned RNG instance: avoids the module-global RNG's shared state
+# and lets callers pass a seed to replay a tournament's pairings.
+_default_rng = Random()
+
+# Prepared once at import; execute() reuses the compiled form from the
+# statement cache instead of rebuilding the select per call
+_PLAYER_VOTE_Q = select(Vote).where(
+    Vote.session_id == bindparam("session_id"),
+    Vote.player_id == bindparam("player_id"),
+    Vote.round_number == bindparam("round_number"),
+    Vote.pair_index == bindparam("pair_index")
+)
+
 
 class VotingEngine:
     """Handles voting logic and determines winners"""
@@ -54,61 +76,71 @@ class VotingEngine:
             DuplicateVoteError: If player already voted for this pair
             InvalidVoteError: If vote is invalid
         """
-        # Check if player already voted for this pair
-        existing_vote = await self._get_player_vote(
-            db, session_id, player_id, round_number, pair_index
+        # Optimistic insert: the unique vote index detects duplicates in
+        # the same statement, so the common case costs one round-trip and
+        # a conflict does not abort the transaction
+        stmt = (
+            pg_insert(Vote)
+            .values(
+                session_id=session_id,
+                player_id=player_id,
+                item_id=item_id,
+                round_number=round_number,
+                pair_index=pair_index,
+                weight=self.organizer_vote_weight if is_organizer else 1.0
+            )
+            .on_conflict_do_nothing(
+                index_elements=["session_id", "player_id", "round_number", "pair_index"]
+            )
+            .returning(Vote)
         )
-        
-        if existing_vote:
+        result = await db.execute(stmt)
+        vote = result.scalar_one_or_none()
+
+        if vote is None:
             raise DuplicateVoteError(
                 f"Player {player_id} already voted for round {round_number}, pair {pair_index}"
             )
-        
-        # Create vote
-        vote = Vote(
-            session_id=session_id,
-            player_id=player_id,
-            item_id=item_id,
-            round_number=round_number,
-            pair_index=pair_index,
-            weight=self.organizer_vote_weight if is_organizer else 1.0
+
+        # Keep the session's denormalized vote counter in step
+        await db.execute(
+            update(GameSession)
+            .where(GameSession.id == session_id)
+            .values(vote_count=GameSession.vote_count + 1)
         )
-        
-        db.add(vote)
-        await db.flush()
-        
+        _bump_sessions_version()
+
         logger.info(f"Vote cast: player={player_id}, item={item_id}, round={round_number}, pair={pair_index}")
         return vote
     
-    async def get_vote_counts(
+    def get_vote_counts(
         self,
         votes: List[Vote],
         item_ids: List[UUID]
     ) -> Dict[UUID, float]:
         """
         Calculate vote counts for items
-        
+
+        Pure CPU work, so it is a plain function; the zero-filled dict
+        doubles as the membership filter, one lookup per vote.
+
         Args:
             votes: List of votes
             item_ids: List of item IDs in the pair
-            
+
         Returns:
             Dictionary of item_id -> vote count
         """
-        vote_counts = defaultdict(float)
-        
-        # Initialize counts for all items
-        for item_id in item_ids:
-            vote_counts[item_id] = 0.0
-        
-        # Count votes with weights
+        vote_counts = dict.fromkeys(item_ids, 0.0)
+
         for vote in votes:
-            if vote.item_id in item_ids:
-                vote_counts[vote.item_id] += vote.weight
-        
-        return dict(vote_counts)
+            current = vote_counts.get(vote.item_id)
+            if current is not None:
+                vote_counts[vote.item_id] = current + vote.weight
+
+        return vote_counts
     
-    async def determine_winner(
+    def determine_winner(
         self,
         vote_counts: Dict[UUID, float],
         player_count: int,
@@ -127,7 +159,17 @@ class VotingEngine:
         """
         if not vote_counts:
             return None
-        
+
+        # Two-item pairs are the normal case: one comparison instead of
+        # a max() scan plus a winners comprehension
+        if len(vote_counts) == 2:
+            (item_a, votes_a), (item_b, votes_b) = vote_counts.items()
+            if votes_a > votes_b:
+                return item_a
+            if votes_b > votes_a:
+                return item_b
+            return None
+
         # Find items with max votes
         max_votes = max(vote_counts.values())
         winners = [item_id for item_id, count in vote_counts.items() if count == max_votes]
@@ -147,23 +189,38 @@ class VotingEngine:
     
     async def check_all_players_voted(
         self,
-        votes: List[Vote],
+        db: AsyncSession,
+        session_id: UUID,
+        round_number: int,
+        pair_index: int,
         player_count: int
     ) -> bool:
         """
-        Check if all players have voted
-        
+        Check if all players have voted on a pair
+
+        The distinct-voter dedup runs in the database as an indexed
+        COUNT(DISTINCT player_id), so no vote rows are hydrated.
+
         Args:
-            votes: List of votes for current pair
+            db: Database session
+            session_id: Game session ID
+            round_number: Round number
+            pair_index: Pair index
             player_count: Total number of players
-            
+
         Returns:
             True if all players voted
         """
-        unique_voters = set(vote.player_id for vote in votes)
-        return len(unique_voters) >= player_count
+        result = await db.execute(
+            select(func.count(func.distinct(Vote.player_id))).where(
+                Vote.session_id == session_id,
+                Vote.round_number == round_number,
+                Vote.pair_index == pair_index
+            )
+        )
+        return (result.scalar() or 0) >= player_count
     
-    async def resolve_tie(
+    def resolve_tie(
         self,
         tie_breaker_choice: UUID,
         tied_items: List[UUID]
@@ -198,17 +255,9 @@ class VotingEngine:
         Returns:
             Total number of rounds
         """
-        rounds = 0
-        remaining = item_count
-        
-        while remaining > 1:
-            rounds += 1
-            # Calculate pairs and byes
-            pairs = remaining // 2
-            bye = remaining % 2
-            remaining = pairs + bye
-        
-        return rounds
+        # ceil(log2(n)) as a single C-level int op: each round halves
+        # the field, byes round up
+        return 0 if item_count <= 1 else (item_count - 1).bit_length()
     
     def calculate_round_pairs(self, item_count: int) -> Tuple[int, int]:
         """
@@ -220,10 +269,75 @@ class VotingEngine:
         Returns:
             Tuple of (pairs, byes)
         """
-        pairs = item_count // 2
-        bye = item_count % 2
-        return pairs, bye
+        return divmod(item_count, 2)
     
+    async def cast_votes_batch(
+        self,
+        db: AsyncSession,
+        session_id: UUID,
+        votes: List[Dict]
+    ) -> List[Vote]:
+        """
+        Cast several votes with one duplicate check and one INSERT
+
+        Each vote dict carries player_id, item_id, round_number,
+        pair_index and optionally is_organizer. One tuple-IN SELECT finds
+        all conflicts up front, then the remaining votes are flushed
+        together, so P votes cost two round-trips instead of 2P.
+
+        Args:
+            db: Database session
+            session_id: Game session ID
+            votes: Vote payload dicts
+
+        Returns:
+            Created votes
+
+        Raises:
+            DuplicateVoteError: If any player already voted for their pair
+        """
+        if not votes:
+            return []
+
+        keys = [
+            (v["player_id"], v["round_number"], v["pair_index"]) for v in votes
+        ]
+        result = await db.execute(
+            select(Vote.player_id, Vote.round_number, Vote.pair_index).where(
+                Vote.session_id == session_id,
+                tuple_(Vote.player_id, Vote.round_number, Vote.pair_index).in_(keys)
+            )
+        )
+        conflicts = set(result.all())
+        if conflicts:
+            raise DuplicateVoteError(
+                f"Votes already cast for session {session_id}: {sorted(conflicts)}"
+            )
+
+        new_votes = [
+            Vote(
+                session_id=session_id,
+                player_id=v["player_id"],
+                item_id=v["item_id"],
+                round_number=v["round_number"],
+                pair_index=v["pair_index"],
+                weight=self.organizer_vote_weight if v.get("is_organizer") else 1.0
+            )
+            for v in votes
+        ]
+        db.add_all(new_votes)
+        await db.flush()
+
+        # Keep the session's denormalized vote counter in step
+        await db.execute(
+            update(GameSession)
+            .where(GameSession.id == session_id)
+            .values(vote_count=GameSession.vote_count + len(new_votes))
+        )
+        _bump_sessions_version()
+
+        return new_votes
+
     async def _get_player_vote(
         self,
         db: AsyncSession,
@@ -233,41 +347,43 @@ class VotingEngine:
         pair_index: int
     ) -> Optional[Vote]:
         """Get a player's vote for a specific pair"""
-        from sqlalchemy import select
-        
-        query = select(Vote).where(
-            Vote.session_id == session_id,
-            Vote.player_id == player_id,
-            Vote.round_number == round_number,
-            Vote.pair_index == pair_index
+        result = await db.execute(
+            _PLAYER_VOTE_Q,
+            {
+                "session_id": session_id,
+                "player_id": player_id,
+                "round_number": round_number,
+                "pair_index": pair_index
+            }
         )
-        
-        result = await db.execute(query)
         return result.scalar_one_or_none()
     
-    def generate_pairs(self, items: List[UUID], shuffle: bool = True) -> List[Tuple[UUID, UUID]]:
+    def generate_pairs(
+        self,
+        items: List[UUID],
+        shuffle: bool = True,
+        seed: Optional[int] = None
+    ) -> List[Tuple[UUID, UUID]]:
         """
         Generate pairs from a list of items
-        
+
         Args:
             items: List of item IDs
             shuffle: Whether to shuffle items before pairing
-            
+            seed: Optional seed for reproducible pairings
+
         Returns:
             List of pairs (tuples)
         """
-        import random
-        
         items_copy = items.copy()
-        
+
         if shuffle:
-            random.shuffle(items_copy)
-        
-        pairs = []
-        for i in range(0, len(items_copy) - 1, 2):
-            pairs.append((items_copy[i], items_copy[i + 1]))
-        
-        return pairs
+            rng = Random(seed) if seed is not None else _default_rng
+            rng.shuffle(items_copy)
+
+        # Stride slices pair neighbours in C; an odd trailing item is
+        # dropped by zip and becomes the bye
+        return list(zip(items_copy[0::2], items_copy[1::2]))
     
     def get_bye_item(self, items: List[UUID], paired_items: Set[UUID]) -> Optional[UUID]:
         """
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import uuid4
 
-from sqlalchemy import Column, String, Boolean, DateTime, Index
+from sqlalchemy import Column, String, Boolean, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -111,8 +111,29 @@ class User(Base):
     __table_args__ = (
         Index("idx_user_email", "email"),
         Index("idx_user_nickname", "nickname"),
-        Index("idx_user_is_guest", "is_guest"),
+        # Partial: the guest/registered counts only ever look at active
+        # accounts, so inactive rows just bloat a full index
+        Index(
+            "idx_user_active_guest",
+            "is_guest",
+            postgresql_where=text("is_active = true")
+        ),
         Index("idx_user_created_at", "created_at"),
+        # Trigram GIN indexes back the admin search's %term% ILIKE
+        # filters; requires the pg_trgm extension (created at startup in
+        # development, CREATE EXTENSION IF NOT EXISTS pg_trgm elsewhere)
+        Index(
+            "idx_user_nickname_trgm",
+            "nickname",
+            postgresql_using="gin",
+            postgresql_ops={"nickname": "gin_trgm_ops"}
+        ),
+        Index(
+            "idx_user_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"}
+        ),
     )
     
     def __repr__(self) -> str:
@@ -5,22 +5,46 @@ Data access layer for user entities
 import logging
 from typing import List, Optional, Tuple
 from uuid import UUID
-from datetime import datetime
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, update, and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.modules.user.models import User
+from src.modules.user.exceptions import InvalidUserDataError
 from src.modules.competition.models import Competition
-from src.modules.session.models import GameSession, SessionPlayer
+from src.modules.session.models import GameSession, SessionPlayer, Vote
 
 logger = logging.getLogger(__name__)
 
+# Page sizes above this stream on a server-side cursor instead of
+# materializing the whole result list in one allocation
+_STREAM_THRESHOLD = 200
+
+
+def _user_cache(db: AsyncSession) -> dict:
+    """
+    Per-session user lookup cache stored on the session's info dict
+
+    Auth resolves the current user on every authenticated request, and a
+    handler frequently looks the same user up again. Caching on db.info
+    scopes entries to one request's database session, so nothing is
+    shared across requests and no external invalidation is needed; the
+    write paths still evict eagerly within the session.
+    """
+    return db.info.setdefault("user_cache", {})
+
 
 class UserRepository:
     """Repository class for user data access"""
-    
+
+    # Real column names minus the immutables; unknown keys are rejected
+    # rather than silently dropped
+    _USER_UPDATABLE = frozenset(
+        c.name for c in User.__table__.columns
+    ) - {"id", "created_at"}
+
     async def create(
         self,
         db: AsyncSession,
@@ -28,33 +52,38 @@ class UserRepository:
         password_hash: Optional[str],
         nickname: str,
         is_guest: bool = False
-    ) -> User:
+    ) -> Optional[User]:
         """
-        Create a new user
-        
+        Create a new user with an optimistic email insert
+
+        The INSERT carries ON CONFLICT (email) DO NOTHING, so a duplicate
+        email is detected by the insert itself instead of a separate
+        existence probe; guests have a NULL email and never conflict.
+
         Args:
             db: Database session
             email: User email (optional for guests)
             password_hash: Hashed password (optional for guests)
             nickname: Display name
             is_guest: Whether this is a guest user
-            
+
         Returns:
-            Created user
-        """
-        user = User(
-            email=email,
-            password_hash=password_hash,
-            nickname=nickname,
-            is_guest=is_guest,
-            is_active=True
+            Created user, or None if the email is already taken
+        """
+        stmt = (
+            pg_insert(User)
+            .values(
+                email=email,
+                password_hash=password_hash,
+                nickname=nickname,
+                is_guest=is_guest,
+                is_active=True
+            )
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User)
         )
-        
-        db.add(user)
-        await db.flush()
-        await db.refresh(user)
-        
-        return user
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
     
     async def get_by_id(
         self,
@@ -71,9 +100,17 @@ class UserRepository:
         Returns:
             User or None
         """
+        cache = _user_cache(db)
+        key = ("id", user_id)
+        if key in cache:
+            return cache[key]
+
         query = select(User).where(User.id == user_id)
         result = await db.execute(query)
-        return result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+        if user is not None:
+            cache[key] = user
+        return user
     
     async def get_by_email(
         self,
@@ -90,9 +127,18 @@ class UserRepository:
         Returns:
             User or None
         """
+        cache = _user_cache(db)
+        key = ("email", email)
+        if key in cache:
+            return cache[key]
+
         query = select(User).where(User.email == email)
         result = await db.execute(query)
-        return result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+        if user is not None:
+            cache[key] = user
+            cache[("id", user.id)] = user
+        return user
     
     async def get_by_nickname(
         self,
@@ -109,9 +155,18 @@ class UserRepository:
         Returns:
             User or None
         """
+        cache = _user_cache(db)
+        key = ("nickname", nickname)
+        if key in cache:
+            return cache[key]
+
         query = select(User).where(User.nickname == nickname)
         result = await db.execute(query)
-        return result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+        if user is not None:
+            cache[key] = user
+            cache[("id", user.id)] = user
+        return user
     
     async def update(
         self,
@@ -130,16 +185,35 @@ class UserRepository:
         Returns:
             Updated user
         """
-        for key, value in kwargs.items():
-            if hasattr(user, key):
-                setattr(user, key, value)
-        
-        user.updated_at = datetime.utcnow()
-        
-        await db.flush()
-        await db.refresh(user)
-        
-        return user
+        unknown = kwargs.keys() - self._USER_UPDATABLE
+        if unknown:
+            raise InvalidUserDataError(
+                f"Cannot update fields: {sorted(unknown)}"
+            )
+
+        # Single Core UPDATE ... RETURNING with a DB-side timestamp; the
+        # RETURNING row repopulates the instance, so attributes stay
+        # readable without a follow-up SELECT
+        values = dict(kwargs)
+        values["updated_at"] = func.now()
+
+        stmt = (
+            update(User)
+            .where(User.id == user.id)
+            .values(**values)
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        updated = result.scalar_one()
+
+        # Evict lookup keys that may now point at stale values
+        cache = _user_cache(db)
+        cache.pop(("email", user.email), None)
+        cache.pop(("nickname", user.nickname), None)
+        cache[("id", updated.id)] = updated
+
+        return updated
     
     async def update_last_login(
         self,
@@ -156,10 +230,15 @@ class UserRepository:
         Returns:
             Updated user
         """
-        user.last_login = datetime.utcnow()
-        await db.flush()
-        await db.refresh(user)
-        return user
+        stmt = (
+            update(User)
+            .where(User.id == user.id)
+            .values(last_login=func.now())
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one()
     
     async def delete(
         self,
@@ -176,6 +255,11 @@ class UserRepository:
         Returns:
             True if deleted
         """
+        cache = _user_cache(db)
+        cache.pop(("id", user.id), None)
+        cache.pop(("email", user.email), None)
+        cache.pop(("nickname", user.nickname), None)
+
         await db.delete(user)
         await db.flush()
         return True
@@ -243,8 +327,11 @@ class UserRepository:
         Returns:
             Session count
         """
+        # idx_session_player_unique guarantees one row per (session, user),
+        # so a plain COUNT(*) equals COUNT(DISTINCT session_id) without
+        # the planner's dedup hash
         query = (
-            select(func.count(func.distinct(SessionPlayer.session_id)))
+            select(func.count())
             .select_from(SessionPlayer)
             .where(SessionPlayer.user_id == user_id)
         )
@@ -266,8 +353,6 @@ class UserRepository:
         Returns:
             Vote count
         """
-        from src.modules.session.models import Vote
-        
         query = (
             select(func.count())
             .select_from(Vote)
@@ -277,6 +362,58 @@ class UserRepository:
         result = await db.execute(query)
         return result.scalar() or 0
     
+    async def get_all_stats_counts(
+        self,
+        db: AsyncSession,
+        user_id: UUID
+    ) -> Tuple[int, int, int, int]:
+        """
+        Get all user stat counts in one round-trip
+
+        The four counts are scalar subqueries in a single SELECT, so the
+        stats endpoint pays one round-trip instead of four.
+
+        Args:
+            db: Database session
+            user_id: User ID
+
+        Returns:
+            Tuple of (competitions_created, sessions_organized,
+            sessions_played, total_votes)
+        """
+        competitions = (
+            select(func.count())
+            .select_from(Competition)
+            .where(Competition.created_by == user_id)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        organized = (
+            select(func.count())
+            .select_from(GameSession)
+            .where(GameSession.organizer_id == user_id)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        played = (
+            select(func.count())
+            .select_from(SessionPlayer)
+            .where(SessionPlayer.user_id == user_id)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        votes = (
+            select(func.count())
+            .select_from(Vote)
+            .join(SessionPlayer, Vote.player_id == SessionPlayer.id)
+            .where(SessionPlayer.user_id == user_id)
+            .correlate(None)
+            .scalar_subquery()
+        )
+
+        result = await db.execute(select(competitions, organized, played, votes))
+        return result.one()
+
     # Related data methods
     
     async def get_user_competitions(
@@ -298,26 +435,35 @@ class UserRepository:
         Returns:
             Tuple of (competitions, total_count)
         """
-        # Count query
-        count_query = (
-            select(func.count())
-            .select_from(Competition)
-            .where(Competition.created_by == user_id)
-        )
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
-        
-        # Data query
+        # count(*) OVER () rides along on every row, so the page and the
+        # total come back from one scan instead of a separate COUNT query
         query = (
-            select(Competition)
+            select(Competition, func.count().over().label("total"))
             .where(Competition.created_by == user_id)
             .order_by(Competition.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
+        # Exports and admin dumps pass large limits; stream those in
+        # fixed-size batches instead of one big fetch
+        if limit > _STREAM_THRESHOLD:
+            competitions = []
+            total = 0
+            result = await db.stream(
+                query.execution_options(yield_per=_STREAM_THRESHOLD)
+            )
+            async for row in result:
+                if not competitions:
+                    total = row.total
+                competitions.append(row.Competition)
+            return competitions, total
+
         result = await db.execute(query)
-        competitions = list(result.scalars().all())
-        
+        rows = result.all()
+
+        competitions = [row.Competition for row in rows]
+        total = rows[0].total if rows else 0
+
         return competitions, total
     
     async def get_user_sessions(
@@ -339,28 +485,19 @@ class UserRepository:
         Returns:
             Tuple of (sessions, total_count)
         """
-        # Base query for sessions where user is a player
-        subquery = (
-            select(SessionPlayer.session_id)
-            .where(SessionPlayer.user_id == user_id)
-            .subquery()
-        )
-        
-        # Count query
-        count_query = (
-            select(func.count())
-            .select_from(GameSession)
-            .where(GameSession.id.in_(select(subquery.c.session_id)))
-        )
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
-        
-        # Data query with joins
+        # Core projection of just the seven consumed columns: no ORM
+        # hydration or identity-map work per row, and count(*) OVER ()
+        # still carries the total alongside the page
         query = (
             select(
-                GameSession,
-                SessionPlayer,
-                Competition.name.label("competition_name")
+                GameSession.id,
+                GameSession.code,
+                Competition.name.label("competition_name"),
+                GameSession.status,
+                GameSession.created_at,
+                SessionPlayer.is_organizer,
+                SessionPlayer.nickname.label("player_nickname"),
+                func.count().over().label("total")
             )
             .join(SessionPlayer, GameSession.id == SessionPlayer.session_id)
             .join(Competition, GameSession.competition_id == Competition.id)
@@ -369,24 +506,26 @@ class UserRepository:
             .offset(skip)
             .limit(limit)
         )
-        
-        result = await db.execute(query)
-        
-        # Format results
+
+        # Rows already carry the output names; drop the window column.
+        # Large limits stream on a server-side cursor to cap peak memory.
         sessions = []
-        for row in result.all():
-            session = row.GameSession
-            player = row.SessionPlayer
-            sessions.append({
-                "id": session.id,
-                "code": session.code,
-                "competition_name": row.competition_name,
-                "status": session.status,
-                "created_at": session.created_at,
-                "is_organizer": player.is_organizer,
-                "player_nickname": player.nickname
-            })
-        
+        total = 0
+        if limit > _STREAM_THRESHOLD:
+            result = await db.stream(
+                query.execution_options(yield_per=_STREAM_THRESHOLD)
+            )
+            async for row in result.mappings():
+                session = dict(row)
+                total = session.pop("total")
+                sessions.append(session)
+        else:
+            result = await db.execute(query)
+            for row in result.mappings():
+                session = dict(row)
+                total = session.pop("total")
+                sessions.append(session)
+
         return sessions, total
     
     # Aggregate queries
@@ -439,33 +578,46 @@ class UserRepository:
         Returns:
             Tuple of (users, total_count)
         """
-        # Base query
-        query = select(User)
-        count_query = select(func.count()).select_from(User)
+        # Base query; count(*) OVER () returns the filtered total with
+        # the page itself, so the filters are only applied once
+        query = select(User, func.count().over().label("total"))
         
         # Apply filters
         if search:
-            search_filter = or_(
-                User.nickname.ilike(f"%{search}%"),
-                User.email.ilike(f"%{search}%")
+            # Very short terms thrash the trigram indexes; fall back to a
+            # prefix match, which the plain B-trees serve
+            pattern = f"{search}%" if len(search) < 3 else f"%{search}%"
+            query = query.where(
+                or_(
+                    User.nickname.ilike(pattern),
+                    User.email.ilike(pattern)
+                )
             )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
         
         if is_guest is not None:
             query = query.where(User.is_guest == is_guest)
-            count_query = count_query.where(User.is_guest == is_guest)
-        
-        # Get total count
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
         
         # Apply ordering and pagination
         query = query.order_by(User.created_at.desc())
         query = query.offset(skip).limit(limit)
         
-        # Execute query
+        # Execute query; large pages stream in fixed-size batches
+        if limit > _STREAM_THRESHOLD:
+            users = []
+            total = 0
+            result = await db.stream(
+                query.execution_options(yield_per=_STREAM_THRESHOLD)
+            )
+            async for row in result:
+                if not users:
+                    total = row.total
+                users.append(row.User)
+            return users, total
+
         result = await db.execute(query)
-        users = list(result.scalars().all())
+        rows = result.all()
+
+        users = [row.User for row in rows]
+        total = rows[0].total if rows else 0
         
         return users, total
@@ -3,6 +3,7 @@ Tournament Game Backend - User Service
 Business logic for user management
 """
 import logging
+import secrets
 from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
@@ -50,15 +51,11 @@ class UserService:
         Raises:
             UserAlreadyExistsError: If email already exists
         """
-        # Check if email already exists
-        existing = await self.repository.get_by_email(db, email)
-        if existing:
-            raise UserAlreadyExistsError(f"User with email {email} already exists")
-        
         # Hash password
         password_hash = get_password_hash(password)
         
-        # Create user
+        # Optimistic insert: ON CONFLICT (email) detects a duplicate in
+        # the same statement, so there is no probe-then-insert race
         user = await self.repository.create(
             db=db,
             email=email,
@@ -66,6 +63,8 @@ class UserService:
             nickname=nickname,
             is_guest=False
         )
+        if user is None:
+            raise UserAlreadyExistsError(f"User with email {email} already exists")
         
         logger.info(f"Created registered user: {user.id}")
         return user
@@ -85,9 +84,10 @@ class UserService:
         Returns:
             Created guest user
         """
-        # Generate unique guest identifier
-        import random
-        guest_suffix = f"{random.randint(1000, 9999)}"
+        # ~48 bits of entropy: collisions on the suffix are astronomically
+        # rare, unlike the old 4-digit random which started colliding at a
+        # few dozen concurrent guests sharing a base nickname
+        guest_suffix = secrets.token_urlsafe(6)
         unique_nickname = f"{nickname}#{guest_suffix}"
         
         # Create guest user
@@ -322,18 +322,25 @@ class UserService:
         user = await self.get_user(db, user_id)
         if not user:
             raise UserNotFoundError("User not found")
-        
-        stats = {
+
+        # One SELECT of four scalar subqueries: a single round-trip on
+        # the request's own session, no task fan-out needed
+        (
+            competitions_created,
+            sessions_organized,
+            sessions_played,
+            total_votes
+        ) = await self.repository.get_all_stats_counts(db, user_id)
+
+        return {
             "user_id": user_id,
             "account_type": "guest" if user.is_guest else "registered",
             "member_since": user.created_at,
-            "competitions_created": await self.repository.get_competitions_created_count(db, user_id),
-            "sessions_organized": await self.repository.get_sessions_organized_count(db, user_id),
-            "sessions_played": await self.repository.get_sessions_played_count(db, user_id),
-            "total_votes_cast": await self.repository.get_total_votes_count(db, user_id)
+            "competitions_created": competitions_created,
+            "sessions_organized": sessions_organized,
+            "sessions_played": sessions_played,
+            "total_votes_cast": total_votes
         }
-        
-        return stats
     
     async def get_user_competitions(
         self,
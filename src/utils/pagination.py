@@ -4,6 +4,7 @@ Helper functions for pagination
 """
 from typing import TypeVar, Generic, List, Optional, Dict, Any
 from math import ceil
+from urllib.parse import urlencode
 
 from pydantic import BaseModel
 
@@ -14,20 +15,18 @@ T = TypeVar('T')
 class PaginationParams:
     """
     Pagination parameters helper class
+
+    Slotted, with skip/limit computed once at construction: the class is
+    instantiated per paginated request, so it skips the per-instance
+    dict and the descriptor hop of the old properties.
     """
+    __slots__ = ('page', 'page_size', 'skip', 'limit')
+
     def __init__(self, page: int = 1, page_size: int = 20):
         self.page = max(1, page)
         self.page_size = min(max(1, page_size), 100)  # Max 100 items per page
-    
-    @property
-    def skip(self) -> int:
-        """Calculate number of items to skip"""
-        return (self.page - 1) * self.page_size
-    
-    @property
-    def limit(self) -> int:
-        """Get page size limit"""
-        return self.page_size
+        self.skip = (self.page - 1) * self.page_size
+        self.limit = self.page_size
 
 
 class PageInfo(BaseModel):
@@ -73,7 +72,9 @@ def create_pagination_info(
     has_next = current_page < total_pages
     has_previous = current_page > 1
     
-    return PageInfo(
+    # The fields were just computed with known types, so skip
+    # pydantic-core validation with model_construct
+    return PageInfo.model_construct(
         current_page=current_page,
         page_size=page_size,
         total_pages=total_pages,
@@ -116,7 +117,7 @@ def paginate_list(
         total_items=total_items
     )
     
-    return PaginatedResponse(
+    return PaginatedResponse.model_construct(
         items=paginated_items,
         page_info=page_info
     )
@@ -140,8 +141,6 @@ def create_pagination_links(
     Returns:
         Dictionary with pagination links
     """
-    from urllib.parse import urlencode
-    
     links = {
         "self": None,
         "first": None,
@@ -150,32 +149,23 @@ def create_pagination_links(
         "previous": None
     }
     
-    # Prepare query parameters
-    params = query_params or {}
+    # Encode the non-page parameters once; only the page number varies
+    # between the five links
+    if query_params:
+        base_qs = urlencode({k: v for k, v in query_params.items() if k != "page"})
+    else:
+        base_qs = ""
+    prefix = f"{base_url}?{base_qs}&page=" if base_qs else f"{base_url}?page="
     
-    # Self link
-    params["page"] = current_page
-    links["self"] = f"{base_url}?{urlencode(params)}"
+    links["self"] = f"{prefix}{current_page}"
     
-    # First page
     if current_page > 1:
-        params["page"] = 1
-        links["first"] = f"{base_url}?{urlencode(params)}"
+        links["first"] = f"{prefix}1"
+        links["previous"] = f"{prefix}{current_page - 1}"
     
-    # Last page
     if current_page < total_pages:
-        params["page"] = total_pages
-        links["last"] = f"{base_url}?{urlencode(params)}"
-    
-    # Next page
-    if current_page < total_pages:
-        params["page"] = current_page + 1
-        links["next"] = f"{base_url}?{urlencode(params)}"
-    
-    # Previous page
-    if current_page > 1:
-        params["page"] = current_page - 1
-        links["previous"] = f"{base_url}?{urlencode(params)}"
+        links["last"] = f"{prefix}{total_pages}"
+        links["next"] = f"{prefix}{current_page + 1}"
     
     return links
 
@@ -221,20 +211,11 @@ def calculate_page_range(
     Returns:
         List of page numbers to display
     """
-    if total_pages <= window_size:
-        return list(range(1, total_pages + 1))
-    
-    # Calculate start and end of window
-    half_window = window_size // 2
-    
-    if current_page <= half_window:
-        # Near the beginning
-        return list(range(1, window_size + 1))
-    elif current_page >= total_pages - half_window:
-        # Near the end
-        return list(range(total_pages - window_size + 1, total_pages + 1))
-    else:
-        # In the middle
-        start = current_page - half_window
-        end = current_page + half_window
-        return list(range(start, end + 1))
+    if total_pages <= 0:
+        return []
+    
+    # Clamped window: one range allocation covers the beginning, middle
+    # and end cases that used to be separate branches
+    window = min(window_size, total_pages)
+    start = max(1, min(current_page - window // 2, total_pages - window + 1))
+    return list(range(start, start + window))
@@ -2,6 +2,7 @@
 Tournament Game Backend - Random Utilities
 Helper functions for random generation
 """
+import hashlib
 import random
 import string
 import secrets
@@ -10,6 +11,21 @@ from uuid import uuid4
 
 T = TypeVar('T')
 
+# Session-code alphabet with the confusable characters removed,
+# precomputed as bytes: 31 symbols, so a masked byte (b & 0x1F) indexes
+# it directly with a 1-in-32 rejection rate
+_CONFUSING_CHARS = frozenset('0O1IL')
+_SESSION_CODE_BYTES = ''.join(
+    c for c in string.ascii_uppercase + string.digits
+    if c not in _CONFUSING_CHARS
+).encode('ascii')
+
+# Exactly 64 URL-safe symbols: every masked byte (b & 0x3F) is a valid
+# index, no rejection sampling needed
+_SHARE_CODE_BYTES = (string.ascii_letters + string.digits + '-_').encode('ascii')
+
+_CELEBRATION_EMOJIS = ('🎉', '🎊', '🏆', '🥇', '🌟', '✨', '🎯', '🔥', '💫', '⭐')
+
 
 def generate_session_code(
     length: int = 6,
@@ -25,14 +41,23 @@ def generate_session_code(
     Returns:
         Random session code
     """
-    if alphabet is None:
-        alphabet = string.ascii_uppercase + string.digits
-    
-    # Remove confusing characters
-    confusing_chars = ['0', 'O', '1', 'I', 'L']
-    alphabet = ''.join(char for char in alphabet if char not in confusing_chars)
-    
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    if alphabet is not None:
+        # Custom alphabets take the generic per-character path
+        alphabet = ''.join(c for c in alphabet if c not in _CONFUSING_CHARS)
+        return ''.join(secrets.choice(alphabet) for _ in range(length))
+
+    # Default alphabet: one urandom draw covers the whole code, with
+    # masked-byte rejection sampling keeping the distribution uniform
+    out = bytearray()
+    bound = len(_SESSION_CODE_BYTES)
+    while len(out) < length:
+        for b in secrets.token_bytes(2 * (length - len(out))):
+            idx = b & 0x1F
+            if idx < bound:
+                out.append(_SESSION_CODE_BYTES[idx])
+                if len(out) == length:
+                    break
+    return out.decode('ascii')
 
 
 def generate_unique_nickname(base_name: str, max_suffix: int = 9999) -> str:
@@ -71,13 +96,12 @@ def shuffle_items(items: List[T], seed: Optional[int] = None) -> List[T]:
     Returns:
         Shuffled list (new list, original unchanged)
     """
-    items_copy = items.copy()
-    
-    if seed is not None:
-        random.seed(seed)
-    
-    random.shuffle(items_copy)
-    return items_copy
+    # One C-level copy, shuffled in place; a seeded Random instance
+    # keeps reproducibility without mutating the module-global RNG
+    out = list(items)
+    shuffle = random.Random(seed).shuffle if seed is not None else random.shuffle
+    shuffle(out)
+    return out
 
 
 def create_random_pairs(items: List[T]) -> List[tuple[T, T]]:
@@ -90,13 +114,10 @@ def create_random_pairs(items: List[T]) -> List[tuple[T, T]]:
     Returns:
         List of pairs (tuples)
     """
+    # Stride slices pair neighbours in C; an odd trailing item is
+    # dropped by zip, same as the old loop
     shuffled = shuffle_items(items)
-    pairs = []
-    
-    for i in range(0, len(shuffled) - 1, 2):
-        pairs.append((shuffled[i], shuffled[i + 1]))
-    
-    return pairs
+    return list(zip(shuffled[0::2], shuffled[1::2]))
 
 
 def select_random_item(items: List[T], exclude: Optional[List[T]] = None) -> Optional[T]:
@@ -114,7 +135,13 @@ def select_random_item(items: List[T], exclude: Optional[List[T]] = None) -> Opt
         return None
     
     if exclude:
-        valid_items = [item for item in items if item not in exclude]
+        # Set membership turns the filter from O(N*M) into O(N+M);
+        # unhashable items fall back to the linear scan
+        try:
+            excluded = set(exclude)
+        except TypeError:
+            excluded = exclude
+        valid_items = [item for item in items if item not in excluded]
         if not valid_items:
             return None
         items = valid_items
@@ -153,9 +180,15 @@ def generate_tournament_seed(competition_id: str, session_code: str) -> int:
     Returns:
         Integer seed for random functions
     """
-    seed_string = f"{competition_id}:{session_code}"
-    # Use hash to create a deterministic integer from the string
-    return hash(seed_string) % (2**32)
+    # blake2b is stable across processes, unlike the salted built-in
+    # hash(): every worker derives the same seed for a session, so
+    # seeded shuffles agree between workers and restarts. An 8-byte
+    # digest keeps the full 64 bits of seed entropy; random.Random
+    # accepts arbitrary-size ints, so nothing downstream truncates it.
+    digest = hashlib.blake2b(
+        f"{competition_id}:{session_code}".encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little")
 
 
 def create_balanced_brackets(
@@ -172,16 +205,14 @@ def create_balanced_brackets(
     Returns:
         List of indices in bracket order
     """
-    if seed is not None:
-        random.seed(seed)
-    
-    indices = list(range(num_items))
-    
+    # sample() draws a full permutation straight from the range object,
+    # skipping the intermediate list build; the seeded path uses its own
+    # Random instance instead of reseeding the global RNG
+    rng = random.Random(seed) if seed is not None else random
+
     # For better bracket balance, we can implement a specific algorithm
     # For now, just shuffle
-    random.shuffle(indices)
-    
-    return indices
+    return rng.sample(range(num_items), num_items)
 
 
 def generate_share_code(length: int = 8) -> str:
@@ -194,9 +225,11 @@ def generate_share_code(length: int = 8) -> str:
     Returns:
         Share code
     """
-    # Use URL-safe characters
-    alphabet = string.ascii_letters + string.digits + '-_'
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    # 64 URL-safe symbols: each byte of a single urandom draw maps
+    # straight into the alphabet
+    return bytes(
+        _SHARE_CODE_BYTES[b & 0x3F] for b in secrets.token_bytes(length)
+    ).decode('ascii')
 
 
 def random_color() -> str:
@@ -206,7 +239,8 @@ def random_color() -> str:
     Returns:
         Hex color string like "#FF5733"
     """
-    return f"#{random.randint(0, 0xFFFFFF):06x}"
+    # Three random bytes hex-encoded in C, no format-spec parsing
+    return '#' + random.randbytes(3).hex()
 
 
 def random_emoji() -> str:
@@ -216,5 +250,4 @@ def random_emoji() -> str:
     Returns:
         Random celebration emoji
     """
-    emojis = ['🎉', '🎊', '🏆', '🥇', '🌟', '✨', '🎯', '🔥', '💫', '⭐']
-    return random.choice(emojis)
+    return random.choice(_CELEBRATION_EMOJIS)
@@ -2,11 +2,49 @@
 Tournament Game Backend - Custom Validators
 Validation utility functions
 """
+import os
 import re
+import string
 from typing import Optional, Tuple, List
 from urllib.parse import urlparse
 import mimetypes
 
+# Patterns compiled once at import; validators run on every request, so
+# the per-call re._compile cache lookup and parse are skipped
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NICKNAME_RE = re.compile(r'^[\w\s-]+$')
+_BLOCKED_NICKNAME_RE = re.compile(r'admin|moderator|system', re.IGNORECASE)
+_COMPETITION_BAD_RE = re.compile(r'\b(spam|xxx)\b', re.IGNORECASE)
+# One pass handles both the strip and the space replacement: any char
+# outside the allowed set becomes '' unless it is whitespace, which
+# becomes '_'
+_FILENAME_CLEAN_RE = re.compile(r'[^\w.-]')
+_FILENAME_DOTS_RE = re.compile(r'\.+')
+
+
+def _filename_clean_char(match: "re.Match") -> str:
+    return '_' if match.group().isspace() else ''
+_HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+_SESSION_CODE_RE = re.compile(r'^[A-Z0-9]{6}$')
+
+# endswith takes the whole tuple in one C-level call, and the error
+# string never changes, so both are built once
+_VALID_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+_INVALID_IMAGE_FORMAT_MSG = (
+    f"Invalid image format. Allowed: {', '.join(_VALID_IMAGE_EXTENSIONS)}"
+)
+
+# Character classes and the common-password list as frozensets: the
+# strength check classifies the password in one pass with set algebra
+# instead of three per-character generator scans
+_DIGITS = frozenset(string.digits)
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_COMMON_PASSWORDS = frozenset([
+    'password', '12345678', 'password123', 'admin123',
+    'qwerty123', 'welcome123', 'password1'
+])
+
 
 def validate_email(email: str) -> Tuple[bool, Optional[str]]:
     """
@@ -21,16 +59,14 @@ def validate_email(email: str) -> Tuple[bool, Optional[str]]:
     if not email:
         return False, "Email is required"
     
-    # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if not re.match(pattern, email):
-        return False, "Invalid email format"
-    
-    # Check length
+    # Length first: an oversized input is rejected in O(1) instead of
+    # being scanned by the regex
     if len(email) > 255:
         return False, "Email is too long (max 255 characters)"
     
+    if not _EMAIL_RE.match(email):
+        return False, "Invalid email format"
+    
     return True, None
 
 
@@ -53,22 +89,20 @@ def validate_password_strength(password: str) -> Tuple[bool, Optional[str]]:
     if len(password) > 100:
         return False, "Password is too long (max 100 characters)"
     
-    if not any(char.isdigit() for char in password):
+    # One pass builds the distinct-character set; the class checks are
+    # then C-level set intersections
+    chars = set(password)
+
+    if chars.isdisjoint(_DIGITS):
         return False, "Password must contain at least one number"
-    
-    if not any(char.isupper() for char in password):
+
+    if chars.isdisjoint(_UPPER):
         return False, "Password must contain at least one uppercase letter"
-    
-    if not any(char.islower() for char in password):
+
+    if chars.isdisjoint(_LOWER):
         return False, "Password must contain at least one lowercase letter"
-    
-    # Check for common passwords
-    common_passwords = [
-        'password', '12345678', 'password123', 'admin123',
-        'qwerty123', 'welcome123', 'password1'
-    ]
-    
-    if password.lower() in common_passwords:
+
+    if password.lower() in _COMMON_PASSWORDS:
         return False, "Password is too common"
     
     return True, None
@@ -94,12 +128,12 @@ def validate_nickname(nickname: str) -> Tuple[bool, Optional[str]]:
         return False, "Nickname is too long (max 50 characters)"
     
     # Allow letters, numbers, spaces, hyphens, underscores
-    if not re.match(r'^[\w\s-]+$', nickname):
+    if not _NICKNAME_RE.match(nickname):
         return False, "Nickname can only contain letters, numbers, spaces, hyphens, and underscores"
     
-    # Check for offensive words (basic example)
-    blocked_words = ['admin', 'moderator', 'system']
-    if any(word in nickname.lower() for word in blocked_words):
+    # Check for offensive words (basic example): one case-insensitive
+    # scan instead of a lowered copy plus a pass per word
+    if _BLOCKED_NICKNAME_RE.search(nickname):
         return False, "Nickname contains restricted words"
     
     return True, None
@@ -118,14 +152,11 @@ def validate_session_code(code: str) -> Tuple[bool, Optional[str]]:
     if not code:
         return False, "Session code is required"
     
-    if len(code) != 6:
-        return False, "Session code must be 6 characters"
-    
-    if not code.isalnum():
-        return False, "Session code must contain only letters and numbers"
-    
-    if not code.isupper():
-        return False, "Session code must be uppercase"
+    # One full-match covers length, alphanumeric and uppercase at once;
+    # it also accepts all-digit codes, which str.isupper() wrongly
+    # rejected for having no cased characters
+    if not _SESSION_CODE_RE.match(code):
+        return False, "Session code must be 6 uppercase letters or numbers"
     
     return True, None
 
@@ -150,7 +181,7 @@ def validate_competition_name(name: str) -> Tuple[bool, Optional[str]]:
         return False, "Competition name is too long (max 255 characters)"
     
     # Basic profanity check (extend as needed)
-    if re.search(r'\b(spam|xxx)\b', name, re.IGNORECASE):
+    if _COMPETITION_BAD_RE.search(name):
         return False, "Competition name contains inappropriate content"
     
     return True, None
@@ -179,11 +210,8 @@ def validate_image_url(url: str) -> Tuple[bool, Optional[str]]:
             return False, "URL is too long (max 500 characters)"
         
         # Check file extension
-        path = result.path.lower()
-        valid_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif']
-        
-        if not any(path.endswith(ext) for ext in valid_extensions):
-            return False, f"Invalid image format. Allowed: {', '.join(valid_extensions)}"
+        if not result.path.lower().endswith(_VALID_IMAGE_EXTENSIONS):
+            return False, _INVALID_IMAGE_FORMAT_MSG
         
         return True, None
         
@@ -226,8 +254,9 @@ def validate_vote_weight(weight: float) -> Tuple[bool, Optional[str]]:
     if weight > 2.0:
         return False, "Vote weight cannot exceed 2.0"
     
-    # Check for reasonable decimal places
-    if len(str(weight).split('.')[-1]) > 2:
+    # Check for reasonable decimal places; round() avoids the string
+    # formatting and its float-repr ambiguities
+    if round(weight, 2) != weight:
         return False, "Vote weight can have at most 2 decimal places"
     
     return True, None
@@ -266,19 +295,14 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    import os
-    
     # Get base name without path
     filename = os.path.basename(filename)
     
-    # Remove special characters
-    filename = re.sub(r'[^\w\s.-]', '', filename)
-    
-    # Replace spaces with underscores
-    filename = filename.replace(' ', '_')
+    # Remove special characters and replace whitespace in one pass
+    filename = _FILENAME_CLEAN_RE.sub(_filename_clean_char, filename)
     
     # Remove multiple dots
-    filename = re.sub(r'\.+', '.', filename)
+    filename = _FILENAME_DOTS_RE.sub('.', filename)
     
     # Limit length
     name, ext = os.path.splitext(filename)
@@ -303,7 +327,7 @@ def validate_hex_color(color: str) -> Tuple[bool, Optional[str]]:
         return False, "Color is required"
     
     # Check format
-    if not re.match(r'^#[0-9A-Fa-f]{6}$', color):
+    if not _HEX_COLOR_RE.match(color):
         return False, "Invalid hex color format (e.g., #FF5733)"
     
     return True, None